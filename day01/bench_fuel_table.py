@@ -0,0 +1,39 @@
+"""
+Benchmarks the lookup-table fuel engine against the recursive part 2 code.
+
+Usage: python bench_fuel_table.py [count] [max_mass]
+"""
+import random
+import sys
+import time
+
+from fuel_table import build_fuel_table, sum_fuel_required_total
+from part2 import find_fuel_required_recursive
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10**7
+    max_mass = int(sys.argv[2]) if len(sys.argv) > 2 else 10**6
+    rng = random.Random(2019)
+    masses = [rng.randint(1, max_mass) for _ in range(count)]
+
+    start = time.perf_counter()
+    build_fuel_table()
+    print(f"table build: {time.perf_counter() - start:.3f}s")
+
+    start = time.perf_counter()
+    expected = sum(find_fuel_required_recursive(x) for x in masses)
+    recursive_seconds = time.perf_counter() - start
+    print(f"recursive:   {recursive_seconds:.3f}s")
+
+    start = time.perf_counter()
+    total = sum_fuel_required_total(masses)
+    table_seconds = time.perf_counter() - start
+    print(f"table:       {table_seconds:.3f}s "
+          f"({recursive_seconds / table_seconds:.1f}x)")
+
+    assert total == expected
+
+
+if __name__ == "__main__":
+    main()
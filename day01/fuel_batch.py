@@ -0,0 +1,80 @@
+"""
+Vectorized fuel computation for large batches of module masses.
+
+Masses are handled as a single int64 NumPy array instead of one Python int
+at a time, so a manifest of tens of millions of modules is processed in a
+handful of whole-array operations.
+"""
+from typing import Tuple
+
+import numpy as np
+
+
+def as_mass_array(masses) -> np.ndarray:
+    """
+    Converts a sequence, NumPy array or buffer of masses to an int64 array.
+    """
+    if isinstance(masses, (bytes, bytearray, memoryview)):
+        return np.frombuffer(masses, dtype=np.int64)
+    return np.asarray(masses, dtype=np.int64)
+
+
+def find_fuel_required_batch(masses) -> np.ndarray:
+    """
+    Finds the fuel required for every module in one vectorized pass.
+    """
+    return as_mass_array(masses) // 3 - 2
+
+
+def find_fuel_required_recursive_batch(masses) -> np.ndarray:
+    """
+    Finds the fuel required for every module, including the fuel for the
+    fuel. Each round applies the fuel equation to all lanes that still need
+    fuel and drops the lanes that reached zero.
+    """
+    fuel = find_fuel_required_batch(masses)
+    np.maximum(fuel, 0, out=fuel)
+    total = fuel.copy()
+    lanes = np.flatnonzero(fuel)
+    fuel = fuel[lanes]
+    while lanes.size:
+        fuel = fuel // 3 - 2
+        alive = fuel > 0
+        lanes = lanes[alive]
+        fuel = fuel[alive]
+        total[lanes] += fuel
+    return total
+
+
+def compute_fuel_batch(
+        masses, recursive: bool = False
+        ) -> Tuple[np.ndarray, int]:
+    """
+    Returns the per-module fuel and the total fuel for a batch of masses.
+    """
+    if recursive:
+        fuel = find_fuel_required_recursive_batch(masses)
+    else:
+        fuel = find_fuel_required_batch(masses)
+    return fuel, int(fuel.sum())
+
+
+assert find_fuel_required_batch([12, 14, 1969, 100756]).tolist() == [
+    2, 2, 654, 33583]
+assert find_fuel_required_recursive_batch([14, 1969, 100756]).tolist() == [
+    2, 966, 50346]
+assert compute_fuel_batch([14, 1969], recursive=True)[1] == 968
+
+
+def parse_input_array(input_file: str) -> np.ndarray:
+    return np.fromfile(input_file, dtype=np.int64, sep=" ")
+
+
+def main():
+    masses = parse_input_array("input")
+    print(compute_fuel_batch(masses)[1])
+    print(compute_fuel_batch(masses, recursive=True)[1])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Multiprocess fuel totals over byte-range shards of a mass manifest.
+
+The manifest is split into byte ranges whose boundaries are moved forward to
+the next newline, so no number is cut in two. Each worker streams its own
+range line by line and returns a partial sum, and the partial sums are added
+up. No process ever holds more than one read buffer of the file.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Tuple
+
+
+READ_HINT = 1 << 20
+
+
+def find_shards(input_file: str, count: int) -> List[Tuple[int, int]]:
+    """
+    Splits a file into at most `count` non-empty byte ranges that start at
+    the beginning of a line.
+    """
+    size = os.path.getsize(input_file)
+    boundaries = [0]
+    with open(input_file, "rb") as f:
+        for i in range(1, count):
+            position = size * i // count
+            if position <= boundaries[-1]:
+                continue
+            f.seek(position - 1)
+            f.readline()
+            position = f.tell()
+            if position >= size:
+                break
+            if position > boundaries[-1]:
+                boundaries.append(position)
+    boundaries.append(size)
+    return [
+        (start, end) for start, end in zip(boundaries[:-1], boundaries[1:])
+        if end > start
+    ]
+
+
+def sum_shard(
+        fuel_function: Callable[[int], int],
+        input_file: str,
+        start: int,
+        end: int,
+        ) -> int:
+    total = 0
+    position = start
+    with open(input_file, "rb") as f:
+        f.seek(start)
+        while position < end:
+            lines = f.readlines(READ_HINT)
+            if not lines:
+                break
+            for line in lines:
+                if position >= end:
+                    break
+                position += len(line)
+                for token in line.split():
+                    total += fuel_function(int(token))
+    return total
+
+
+def sum_fuel_sharded(
+        fuel_function: Callable[[int], int],
+        input_file: str,
+        workers: int,
+        ) -> int:
+    """
+    Sums `fuel_function` over every mass in the file using a pool of
+    `workers` processes, one shard per worker.
+    """
+    shards = find_shards(input_file, workers)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(sum_shard, fuel_function, input_file, start, end)
+            for start, end in shards
+        ]
+        return sum(future.result() for future in futures)
@@ -0,0 +1,99 @@
+"""
+Streaming fuel totals for mass manifests that do not fit in memory.
+
+The manifest is read in fixed-size chunks. Each chunk is cut at its last
+whitespace byte, the complete numbers are parsed in bulk and fed to the
+vectorized fuel engine, and the trailing partial number is carried over to
+the next chunk. Memory use depends on the chunk size only.
+"""
+import sys
+import time
+from typing import BinaryIO, NamedTuple, Tuple
+
+import numpy as np
+
+from fuel_batch import (
+    find_fuel_required_batch, find_fuel_required_recursive_batch)
+
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+WHITESPACE = b" \t\r\n"
+
+
+class StreamTotals(NamedTuple):
+    count: int
+    fuel: int
+    fuel_recursive: int
+    seconds: float
+
+    @property
+    def masses_per_second(self) -> float:
+        if self.seconds <= 0:
+            return float("inf")
+        return self.count / self.seconds
+
+
+def split_complete(data: bytes) -> Tuple[bytes, bytes]:
+    """
+    Splits a buffer into the part holding complete numbers and the trailing
+    part that may continue in the next chunk.
+    """
+    cut = max(data.rfind(c) for c in WHITESPACE) + 1
+    return data[:cut], data[cut:]
+
+
+assert split_complete(b"12\n14\n19") == (b"12\n14\n", b"19")
+assert split_complete(b"12\n14\n") == (b"12\n14\n", b"")
+assert split_complete(b"1969") == (b"", b"1969")
+
+
+def parse_masses(data: bytes) -> np.ndarray:
+    return np.fromstring(data, dtype=np.int64, sep=" ")
+
+
+def stream_fuel_totals(
+        stream: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE
+        ) -> StreamTotals:
+    """
+    Accumulates the part 1 and part 2 fuel totals over a binary stream of
+    whitespace-separated masses.
+    """
+    start = time.perf_counter()
+    count = fuel = fuel_recursive = 0
+    carry = b""
+    while True:
+        chunk = stream.read(chunk_size)
+        if chunk:
+            complete, carry = split_complete(carry + chunk)
+        else:
+            complete, carry = carry, b""
+        if complete.strip():
+            masses = parse_masses(complete)
+            count += masses.size
+            fuel += int(find_fuel_required_batch(masses).sum())
+            fuel_recursive += int(
+                find_fuel_required_recursive_batch(masses).sum())
+        if not chunk:
+            break
+    return StreamTotals(
+        count, fuel, fuel_recursive, time.perf_counter() - start)
+
+
+def stream_fuel_totals_from_file(
+        input_file: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+        ) -> StreamTotals:
+    with open(input_file, "rb") as f:
+        return stream_fuel_totals(f, chunk_size)
+
+
+def main():
+    input_file = sys.argv[1] if len(sys.argv) > 1 else "input"
+    totals = stream_fuel_totals_from_file(input_file)
+    print(totals.fuel)
+    print(totals.fuel_recursive)
+    print(f"{totals.count} masses in {totals.seconds:.3f}s "
+          f"({totals.masses_per_second:,.0f} masses/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Non-recursive fuel-for-fuel computation backed by a lookup table.
+
+The total fuel for every mass below the table size is precomputed once.
+Larger masses apply the fuel equation in a short loop until they fall
+inside the table, which takes a single step for masses up to three times the
+table size. Masses of any size work because nothing recurses.
+"""
+from functools import lru_cache
+from typing import Iterable, List
+
+
+DEFAULT_TABLE_SIZE = 1 << 18
+
+
+@lru_cache(maxsize=None)
+def build_fuel_table(size: int = DEFAULT_TABLE_SIZE) -> List[int]:
+    """
+    Returns a list whose entry at index m is the total fuel, fuel for fuel
+    included, for a module of mass m. The fuel for a mass is always smaller
+    than the mass, so each entry only looks up entries already filled in.
+    The table must cover every mass below 9, the ones that need no fuel.
+    """
+    if size < 9:
+        raise ValueError("table size must be at least 9")
+    table = [0] * size
+    for mass in range(9, size):
+        fuel = mass // 3 - 2
+        table[mass] = fuel + table[fuel]
+    return table
+
+
+def find_fuel_required_total(
+        mass: int, table_size: int = DEFAULT_TABLE_SIZE
+        ) -> int:
+    table = build_fuel_table(table_size)
+    total = 0
+    while mass >= table_size:
+        mass = mass // 3 - 2
+        total += mass
+    if mass < 0:
+        return total
+    return total + table[mass]
+
+
+assert find_fuel_required_total(14) == 2
+assert find_fuel_required_total(1969) == 966
+assert find_fuel_required_total(100756) == 50346
+assert find_fuel_required_total(100756, table_size=16) == 50346
+assert find_fuel_required_total(0) == 0
+
+
+def sum_fuel_required_total(
+        masses: Iterable[int], table_size: int = DEFAULT_TABLE_SIZE
+        ) -> int:
+    """
+    Sums the total fuel over many masses, with the table lookup inlined for
+    masses that are already inside the table.
+    """
+    table = build_fuel_table(table_size)
+    total = 0
+    for mass in masses:
+        if 0 <= mass < table_size:
+            total += table[mass]
+        else:
+            total += find_fuel_required_total(mass, table_size)
+    return total
+
+
+assert sum_fuel_required_total([14, 1969, 100756, 10**30]) == (
+    2 + 966 + 50346 + find_fuel_required_total(10**30))
+
+
+def main():
+    with open("input") as f:
+        masses = [int(line) for line in f.read().split()]
+    print(sum_fuel_required_total(masses))
+
+
+if __name__ == "__main__":
+    main()
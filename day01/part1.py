@@ -34,6 +34,9 @@ input), then add together all the fuel values.
 What is the sum of the fuel requirements for all of the modules on your
 spacecraft?
 """
+import argparse
+
+from fuel_shard import sum_fuel_sharded
 
 
 def find_fuel_required(mass: int) -> int:
@@ -56,7 +59,17 @@ def parse_input(input_file):
 
 
 def main():
-    print(sum(find_fuel_required(x) for x in parse_input("input")))
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input_file", nargs="?", default="input")
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+    if args.workers > 1:
+        total = sum_fuel_sharded(
+            find_fuel_required, args.input_file, args.workers)
+    else:
+        total = sum(
+            find_fuel_required(x) for x in parse_input(args.input_file))
+    print(total)
 
 
 if __name__ == "__main__":
@@ -31,6 +31,9 @@ spacecraft when also taking into account the mass of the added fuel? (Calculate
 the fuel requirements for each module separately, then add them all up at the
 end.)
 """
+import argparse
+
+from fuel_shard import sum_fuel_sharded
 from part1 import find_fuel_required, parse_input
 
 
@@ -48,7 +51,18 @@ assert find_fuel_required_recursive(100756) == 50346
 
 
 def main():
-    print(sum(find_fuel_required_recursive(x) for x in parse_input("input")))
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input_file", nargs="?", default="input")
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+    if args.workers > 1:
+        total = sum_fuel_sharded(
+            find_fuel_required_recursive, args.input_file, args.workers)
+    else:
+        total = sum(
+            find_fuel_required_recursive(x)
+            for x in parse_input(args.input_file))
+    print(total)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,35 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from fuel_batch import compute_fuel_batch  # noqa: E402
+
+
+def test_compute_fuel_batch():
+
+    def _fuel(mass):
+        return mass // 3 - 2
+
+    def _fuel_recursive(mass):
+        total = 0
+        fuel = _fuel(mass)
+        while fuel > 0:
+            total += fuel
+            fuel = _fuel(fuel)
+        return total
+
+    rng = random.Random(2019)
+    masses = [rng.randint(0, 10**9) for _ in range(10000)]
+
+    fuel, total = compute_fuel_batch(np.array(masses))
+    assert fuel.tolist() == [_fuel(m) for m in masses]
+    assert total == sum(_fuel(m) for m in masses)
+
+    fuel, total = compute_fuel_batch(masses, recursive=True)
+    assert fuel.tolist() == [_fuel_recursive(m) for m in masses]
+    assert total == sum(_fuel_recursive(m) for m in masses)
+
+    buffer = np.array([12, 1969], dtype=np.int64).tobytes()
+    assert compute_fuel_batch(buffer)[1] == 656
@@ -0,0 +1,27 @@
+from fuel_shard import find_shards, sum_fuel_sharded, sum_shard
+
+
+def _fuel(mass):
+    return mass // 3 - 2
+
+
+def test_find_shards(tmp_path):
+    input_file = tmp_path / "input"
+    input_file.write_bytes(b"12\n14\n1969\n100756")
+
+    for count in range(1, 10):
+        shards = find_shards(str(input_file), count)
+        assert shards[0][0] == 0
+        assert shards[-1][1] == 17
+        assert all(a[1] == b[0] for a, b in zip(shards[:-1], shards[1:]))
+        assert sum(
+            sum_shard(_fuel, str(input_file), start, end)
+            for start, end in shards) == 2 + 2 + 654 + 33583
+
+
+def test_sum_fuel_sharded(tmp_path):
+    input_file = tmp_path / "input"
+    masses = list(range(1, 5000))
+    input_file.write_text("\n".join(str(x) for x in masses) + "\n")
+    expected = sum(_fuel(x) for x in masses)
+    assert sum_fuel_sharded(_fuel, str(input_file), 3) == expected
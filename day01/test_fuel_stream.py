@@ -0,0 +1,22 @@
+import io
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from fuel_stream import stream_fuel_totals  # noqa: E402
+
+
+def test_stream_fuel_totals():
+    data = b"12\n14\n1969\n100756\n"
+    for chunk_size in [1, 2, 3, 5, 7, 64]:
+        totals = stream_fuel_totals(io.BytesIO(data), chunk_size)
+        assert totals.count == 4
+        assert totals.fuel == 2 + 2 + 654 + 33583
+        assert totals.fuel_recursive == 2 + 2 + 966 + 50346
+
+    totals = stream_fuel_totals(io.BytesIO(b"1969 100756"), chunk_size=4)
+    assert (totals.count, totals.fuel) == (2, 654 + 33583)
+
+    totals = stream_fuel_totals(io.BytesIO(b""))
+    assert (totals.count, totals.fuel, totals.fuel_recursive) == (0, 0, 0)
@@ -0,0 +1,15 @@
+import pytest
+
+from fuel_table import find_fuel_required_total, sum_fuel_required_total
+
+
+def test_small_table_sizes():
+    for mass in [2, 5, 9, 14, 1969, 100756]:
+        expected = find_fuel_required_total(mass)
+        assert find_fuel_required_total(mass, table_size=9) == expected
+    assert sum_fuel_required_total([2, 5, 14], table_size=9) == 2
+
+    with pytest.raises(ValueError):
+        find_fuel_required_total(2, table_size=1)
+    with pytest.raises(ValueError):
+        sum_fuel_required_total([2, 5], table_size=8)
@@ -0,0 +1,33 @@
+"""
+Compares a full noun and verb sweep through `part2.restore_program` with the
+same sweep through `ProgramRunner`.
+"""
+import time
+from itertools import product
+
+from part2 import restore_program
+from runner import ProgramRunner, parse_program
+
+
+def main():
+    with open("input") as f:
+        line = f.readline().strip()
+    pairs = list(product(range(100), range(100)))
+
+    start = time.perf_counter()
+    expected = [int(restore_program(line, *pair).split(',')[0])
+                for pair in pairs]
+    strings = time.perf_counter() - start
+
+    runner = ProgramRunner(parse_program(line))
+    start = time.perf_counter()
+    outputs = [runner.output(*pair) for pair in pairs]
+    buffer = time.perf_counter() - start
+
+    assert outputs == expected
+    print(f"restore_program: {strings:.3f}s")
+    print(f"ProgramRunner:   {buffer:.3f}s ({strings / buffer:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
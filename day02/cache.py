@@ -0,0 +1,134 @@
+"""
+Memoized address-0 outputs of a day 2 program.
+
+`OutputCache` answers "what is at address 0 after running this program with
+this noun and verb" from an in-memory LRU table first, then from an optional
+sqlite database, and only runs the program when neither has the answer.
+Entries in the database are keyed by a hash of the program, so one database
+file can serve many programs. The cache can be filled in bulk from a
+precomputed sweep.
+"""
+import hashlib
+import sqlite3
+from collections import OrderedDict
+from itertools import product
+from typing import Iterable, Optional, Sequence, Tuple
+
+from runner import ProgramRunner
+
+
+DEFAULT_MAXSIZE = 1 << 16
+
+Pair = Tuple[int, int]
+
+
+def program_hash(program: Sequence[int]) -> str:
+    return hashlib.sha256(
+        ','.join(str(x) for x in program).encode()).hexdigest()
+
+
+class OutputCache:
+    def __init__(
+            self,
+            program: Sequence[int],
+            maxsize: int = DEFAULT_MAXSIZE,
+            path: Optional[str] = None,
+            ):
+        self.program = tuple(program)
+        self.key = program_hash(self.program)
+        self.maxsize = maxsize
+        self.entries: "OrderedDict[Pair, int]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._runner: Optional[ProgramRunner] = None
+        self.db: Optional[sqlite3.Connection] = None
+        if path is not None:
+            self.db = sqlite3.connect(path)
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS outputs ("
+                "program TEXT, noun INTEGER, verb INTEGER, output TEXT, "
+                "PRIMARY KEY (program, noun, verb)) WITHOUT ROWID")
+
+    def __enter__(self) -> "OutputCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self.db is not None:
+            self.db.commit()
+            self.db.close()
+            self.db = None
+
+    def _remember(self, pair: Pair, output: int) -> None:
+        self.entries[pair] = output
+        self.entries.move_to_end(pair)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def _load(self, pair: Pair) -> Optional[int]:
+        if self.db is None:
+            return None
+        row = self.db.execute(
+            "SELECT output FROM outputs "
+            "WHERE program = ? AND noun = ? AND verb = ?",
+            (self.key, *pair)).fetchone()
+        return None if row is None else int(row[0])
+
+    def _store(self, items: Iterable[Tuple[int, int, int]]) -> None:
+        if self.db is None:
+            return
+        with self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO outputs VALUES (?, ?, ?, ?)",
+                ((self.key, noun, verb, str(output))
+                 for noun, verb, output in items))
+
+    def get(self, noun: int, verb: int) -> int:
+        pair = (noun, verb)
+        output = self.entries.get(pair)
+        if output is not None:
+            self.hits += 1
+            self.entries.move_to_end(pair)
+            return output
+        self.misses += 1
+        output = self._load(pair)
+        if output is None:
+            if self._runner is None:
+                self._runner = ProgramRunner(self.program)
+            output = self._runner.output(noun, verb)
+            self._store([(noun, verb, output)])
+        self._remember(pair, output)
+        return output
+
+    def warm(self, items: Iterable[Tuple[int, int, int]]) -> None:
+        """
+        Adds precomputed (noun, verb, output) triples to the cache.
+        """
+        items = list(items)
+        for noun, verb, output in items:
+            self._remember((noun, verb), output)
+        self._store(items)
+
+    def warm_sweep(self, end: int = 99, start: int = 0) -> None:
+        """
+        Runs every pair in [start, end] and adds the outputs to the cache.
+        Pairs for which the program fails are skipped.
+        """
+        runner = ProgramRunner(self.program)
+        items = []
+        for noun, verb in product(range(start, end + 1), repeat=2):
+            try:
+                items.append((noun, verb, runner.output(noun, verb)))
+            except (IndexError, ValueError):
+                continue
+        self.warm(items)
+
+
+if __name__ == "__main__":
+    with open("input") as f:
+        line = f.readline().strip()
+    with OutputCache([int(x) for x in line.split(',')], path="outputs.db") \
+            as cache:
+        print(cache.get(12, 2))
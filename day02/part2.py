@@ -68,7 +68,7 @@ def search_noun_and_verb(
         opcode_strig: str, target_output: int, end: int = 99,
         ) -> Tuple[int, int]:
     for noun, verb in product(range(end + 1), range(end + 1)):
-        final_memory = restore_program(line, noun, verb)
+        final_memory = restore_program(opcode_strig, noun, verb)
         output = final_memory.split(',')
         if int(output[0]) == target_output:
             break
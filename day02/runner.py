@@ -0,0 +1,93 @@
+"""
+Reusable runner for sweeping a day 2 program over many noun and verb pairs.
+
+The program is parsed once into an immutable tuple. Every run resets a
+preallocated `array('q')` buffer from that tuple in place and executes the
+program in the buffer, so no list is built and no string is formatted or
+parsed per run. The final memory is returned as a read-only view of the
+buffer, which stays valid until the next run.
+
+If a value ever needs more than 64 bits, the runner switches its buffer to
+a list for good; the view follows the switch.
+"""
+from array import array
+from typing import Sequence, Tuple, Union
+
+
+class MemoryView:
+    """
+    Read-only view of the current buffer of a runner.
+    """
+    readonly = True
+
+    def __init__(self, runner: "ProgramRunner"):
+        self._runner = runner
+
+    def __getitem__(self, idx):
+        return self._runner.buffer[idx]
+
+    def __len__(self) -> int:
+        return len(self._runner.buffer)
+
+    def tolist(self) -> list:
+        return list(self._runner.buffer)
+
+
+Memory = MemoryView
+
+
+def parse_program(opcode_string: str) -> Tuple[int, ...]:
+    return tuple(int(x) for x in opcode_string.split(','))
+
+
+class ProgramRunner:
+    def __init__(self, program: Sequence[int]):
+        self.image = tuple(program)
+        try:
+            self.source: Union[array, tuple] = array('q', self.image)
+            self.buffer: Union[array, list] = array('q', self.image)
+        except OverflowError:
+            self._promote()
+        self.view = MemoryView(self)
+
+    def _promote(self) -> None:
+        self.source = self.image
+        self.buffer = list(self.image)
+
+    def run(self, noun: int, verb: int) -> Memory:
+        """
+        Runs the program with the given noun and verb and returns its final
+        memory.
+        """
+        try:
+            return self._run(noun, verb)
+        except OverflowError:
+            if isinstance(self.buffer, list):
+                raise
+            self._promote()
+            return self._run(noun, verb)
+
+    def _run(self, noun: int, verb: int) -> Memory:
+        memory = self.buffer
+        memory[:] = self.source
+        memory[1] = noun
+        memory[2] = verb
+        size = len(memory)
+        for idx in range(0, size, 4):
+            opcode = memory[idx]
+            if opcode == 99:
+                break
+            if idx + 3 >= size:
+                raise IndexError
+            value1 = memory[memory[idx + 1]]
+            value2 = memory[memory[idx + 2]]
+            if opcode == 1:
+                memory[memory[idx + 3]] = value1 + value2
+            elif opcode == 2:
+                memory[memory[idx + 3]] = value1 * value2
+            else:
+                raise ValueError("something went wrong")
+        return self.view
+
+    def output(self, noun: int, verb: int) -> int:
+        return self.run(noun, verb)[0]
@@ -0,0 +1,131 @@
+"""
+Parallel noun and verb search over a process pool.
+
+The noun range is cut into chunks, one task per chunk, and every task tries
+all verbs for its nouns with a `ProgramRunner` built once per worker. Tasks
+report the first pair they see for each target, and the results are merged
+in chunk order, so the pair returned for a target is always the first one in
+`itertools.product` order, as in `part2.search_noun_and_verb`.
+
+As soon as every target has been found and all earlier chunks are done, the
+remaining tasks are cancelled and a shared event tells running workers to
+stop after their current noun. With no targets given, the whole space is
+swept into a table mapping every output to its first pair.
+"""
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, FrozenSet, Iterable, Optional, Sequence, Tuple
+
+from runner import ProgramRunner, parse_program
+
+
+TASKS_PER_WORKER = 8
+
+Pair = Tuple[int, int]
+
+_runner: Optional[ProgramRunner] = None
+_stop = None
+
+
+def _init_worker(program: Tuple[int, ...], stop) -> None:
+    global _runner, _stop
+    _runner = ProgramRunner(program)
+    _stop = stop
+
+
+def _search_nouns(
+        nouns: range, verbs: range, targets: Optional[FrozenSet[int]]
+        ) -> Dict[int, Pair]:
+    found: Dict[int, Pair] = dict()
+    output = _runner.output
+    for noun in nouns:
+        if _stop.is_set():
+            break
+        for verb in verbs:
+            try:
+                value = output(noun, verb)
+            except (IndexError, ValueError):
+                continue
+            if value in found:
+                continue
+            if targets is not None and value not in targets:
+                continue
+            found[value] = (noun, verb)
+            if targets is not None and len(found) == len(targets):
+                return found
+    return found
+
+
+def find_pairs(
+        program: Sequence[int],
+        targets: Optional[Iterable[int]],
+        end: int = 99,
+        start: int = 0,
+        workers: Optional[int] = None,
+        ) -> Dict[int, Pair]:
+    """
+    Maps each target output to the first (noun, verb) pair in [start, end]
+    producing it; targets that are never produced are left out. With
+    `targets` set to None, maps every output the program can produce.
+    """
+    wanted = None if targets is None else frozenset(targets)
+    workers = workers or multiprocessing.cpu_count()
+    nouns = range(start, end + 1)
+    verbs = range(start, end + 1)
+    chunk_size = max(1, -(-len(nouns) // (workers * TASKS_PER_WORKER)))
+    chunks = [
+        nouns[i:i + chunk_size] for i in range(0, len(nouns), chunk_size)
+    ]
+
+    stop = multiprocessing.Event()
+    best: Dict[int, Pair] = dict()
+    with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(tuple(program), stop),
+            ) as executor:
+        futures = [
+            executor.submit(_search_nouns, chunk, verbs, wanted)
+            for chunk in chunks
+        ]
+        for i, future in enumerate(futures):
+            for value, pair in future.result().items():
+                best.setdefault(value, pair)
+            if wanted is not None and wanted <= best.keys():
+                stop.set()
+                for pending in futures[i + 1:]:
+                    pending.cancel()
+                break
+    return best
+
+
+def find_pair(
+        program: Sequence[int],
+        target_output: int,
+        end: int = 99,
+        start: int = 0,
+        workers: Optional[int] = None,
+        ) -> Optional[Pair]:
+    return find_pairs(program, [target_output], end, start, workers).get(
+        target_output)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("targets", type=int, nargs="*", default=[19690720])
+    parser.add_argument("--end", type=int, default=99)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    with open("input") as f:
+        program = parse_program(f.readline().strip())
+
+    pairs = find_pairs(program, args.targets, args.end, workers=args.workers)
+    for target in args.targets:
+        pair = pairs.get(target)
+        print(target, None if pair is None else 100 * pair[0] + pair[1])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""
+Symbolic solver for the noun and verb search of part 2.
+
+The program is run once with the noun and the verb left as unknowns. Every
+memory cell holds an affine expression `constant + a * noun + b * verb`, or
+None once its value can no longer be written that way: a product of two
+non-constant expressions, or a value read through an address that depends
+on the noun or the verb. Reading through such an address is allowed, but
+restricts the noun or verb to the values that keep the address in
+[-size, size), the addresses a concrete run can index without an
+`IndexError`; negative ones wrap around, as they do for Python sequences.
+
+If address 0 ends up as an affine expression, the target output is a linear
+Diophantine equation in the noun and the verb, solved directly with the
+extended Euclidean algorithm. Otherwise the solver falls back to trying
+every pair.
+"""
+from itertools import product
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+from runner import ProgramRunner
+
+
+class Affine(NamedTuple):
+    constant: int
+    noun: int = 0
+    verb: int = 0
+
+    def is_constant(self) -> bool:
+        return self.noun == 0 and self.verb == 0
+
+    def evaluate(self, noun: int, verb: int) -> int:
+        return self.constant + self.noun * noun + self.verb * verb
+
+
+NOUN = Affine(0, 1, 0)
+VERB = Affine(0, 0, 1)
+
+Bounds = Tuple[int, int]
+
+
+class NonLinearProgram(Exception):
+    """
+    Raised when the control flow or a write address of a program depends
+    on the noun or the verb.
+    """
+
+
+def add(x: Optional[Affine], y: Optional[Affine]) -> Optional[Affine]:
+    if x is None or y is None:
+        return None
+    return Affine(x.constant + y.constant, x.noun + y.noun, x.verb + y.verb)
+
+
+def multiply(x: Optional[Affine], y: Optional[Affine]) -> Optional[Affine]:
+    if x is None or y is None:
+        return None
+    if not x.is_constant():
+        x, y = y, x
+    if not x.is_constant():
+        return None
+    c = x.constant
+    return Affine(c * y.constant, c * y.noun, c * y.verb)
+
+
+def restrict(bounds: Bounds, offset: int, scale: int, size: int) -> Bounds:
+    """
+    Restricts `bounds` to the values x with 0 <= offset + scale * x < size.
+    """
+    low, high = bounds
+    if scale > 0:
+        low = max(low, -(offset // scale))
+        high = min(high, (size - 1 - offset) // scale)
+    else:
+        low = max(low, -((size - 1 - offset) // -scale))
+        high = min(high, offset // -scale)
+    return low, high
+
+
+assert restrict((0, 99), 0, 1, 50) == (0, 49)
+assert restrict((0, 99), 10, -2, 50) == (0, 5)
+
+
+def execute_symbolic(
+        program: Sequence[int], noun_bounds: Bounds, verb_bounds: Bounds
+        ) -> Tuple[Optional[Affine], Bounds, Bounds]:
+    """
+    Runs the program with symbolic noun and verb. Returns the expression
+    left at address 0 and the noun and verb bounds for which the run does
+    not read outside memory.
+    """
+    size = len(program)
+    memory: List[Optional[Affine]] = [Affine(x) for x in program]
+    memory[1] = NOUN
+    memory[2] = VERB
+
+    def _constant(cell):
+        value = memory[cell]
+        if value is None or not value.is_constant():
+            raise NonLinearProgram(cell)
+        return value.constant
+
+    def _read(cell):
+        nonlocal noun_bounds, verb_bounds
+        address = memory[cell]
+        if address is None or (address.noun and address.verb):
+            raise NonLinearProgram(cell)
+        # shifted by size, so negative addresses that wrap are kept
+        if address.noun:
+            noun_bounds = restrict(
+                noun_bounds, address.constant + size, address.noun, 2 * size)
+            return None
+        if address.verb:
+            verb_bounds = restrict(
+                verb_bounds, address.constant + size, address.verb, 2 * size)
+            return None
+        return memory[address.constant]
+
+    for idx in range(0, size, 4):
+        opcode = _constant(idx)
+        if opcode == 99:
+            break
+        if idx + 3 >= size:
+            raise IndexError
+        value1 = _read(idx + 1)
+        value2 = _read(idx + 2)
+        if opcode == 1:
+            memory[_constant(idx + 3)] = add(value1, value2)
+        elif opcode == 2:
+            memory[_constant(idx + 3)] = multiply(value1, value2)
+        else:
+            raise ValueError("something went wrong")
+    return memory[0], noun_bounds, verb_bounds
+
+
+def extended_gcd(a: int, b: int) -> Tuple[int, int, int]:
+    """
+    Returns (g, x, y) with a * x + b * y == g == gcd(a, b).
+    """
+    x0, y0, x1, y1 = 1, 0, 0, 1
+    while b:
+        q, a, b = a // b, b, a % b
+        x0, x1 = x1, x0 - q * x1
+        y0, y1 = y1, y0 - q * y1
+    return a, x0, y0
+
+
+assert extended_gcd(240, 46) == (2, -9, 47)
+
+
+def solve_linear(
+        a: int, b: int, rhs: int, noun_bounds: Bounds, verb_bounds: Bounds
+        ) -> Optional[Tuple[int, int]]:
+    """
+    Returns the solution of a * noun + b * verb == rhs inside the bounds
+    with the smallest noun, then the smallest verb.
+    """
+    (noun_low, noun_high), (verb_low, verb_high) = noun_bounds, verb_bounds
+    if noun_low > noun_high or verb_low > verb_high:
+        return None
+    if a == 0 and b == 0:
+        return (noun_low, verb_low) if rhs == 0 else None
+    if b == 0:
+        if rhs % a or not noun_low <= rhs // a <= noun_high:
+            return None
+        return rhs // a, verb_low
+    if a == 0:
+        if rhs % b or not verb_low <= rhs // b <= verb_high:
+            return None
+        return noun_low, rhs // b
+
+    g, x, y = extended_gcd(a, b)
+    if rhs % g:
+        return None
+    # Every solution is noun = n0 + step_n * k, verb = v0 - step_v * k.
+    n0, v0 = x * (rhs // g), y * (rhs // g)
+    step_n, step_v = b // g, a // g
+
+    def _k_range(base, step, low, high):
+        if step > 0:
+            return -((base - low) // step), (high - base) // step
+        return -((high - base) // -step), (base - low) // -step
+
+    k_low1, k_high1 = _k_range(n0, step_n, noun_low, noun_high)
+    k_low2, k_high2 = _k_range(v0, -step_v, verb_low, verb_high)
+    k_low, k_high = max(k_low1, k_low2), min(k_high1, k_high2)
+    if k_low > k_high:
+        return None
+    k = k_low if step_n > 0 else k_high
+    return n0 + step_n * k, v0 - step_v * k
+
+
+assert solve_linear(100, 1, 1202, (0, 99), (0, 99)) == (12, 2)
+assert solve_linear(3, 5, 8, (0, 99), (0, 99)) == (1, 1)
+assert solve_linear(2, 4, 7, (0, 99), (0, 99)) is None
+assert solve_linear(0, 0, 0, (3, 99), (4, 99)) == (3, 4)
+
+
+def search(
+        program: Sequence[int], target_output: int,
+        noun_bounds: Bounds, verb_bounds: Bounds,
+        ) -> Optional[Tuple[int, int]]:
+    runner = ProgramRunner(program)
+    nouns = range(noun_bounds[0], noun_bounds[1] + 1)
+    verbs = range(verb_bounds[0], verb_bounds[1] + 1)
+    for noun, verb in product(nouns, verbs):
+        try:
+            if runner.output(noun, verb) == target_output:
+                return noun, verb
+        except (IndexError, ValueError):
+            continue
+    return None
+
+
+def solve_noun_and_verb(
+        program: Sequence[int], target_output: int,
+        end: int = 99, start: int = 0,
+        ) -> Optional[Tuple[int, int]]:
+    """
+    Returns the pair with the smallest noun, then the smallest verb, in
+    [start, end] that leaves `target_output` at address 0, or None.
+    """
+    noun_bounds = verb_bounds = (start, end)
+    try:
+        expression, solved_nouns, solved_verbs = execute_symbolic(
+            program, noun_bounds, verb_bounds)
+    except NonLinearProgram:
+        return search(program, target_output, noun_bounds, verb_bounds)
+    except (IndexError, ValueError):
+        # the control flow does not depend on the noun or the verb, so the
+        # program fails for every pair
+        return None
+    if expression is None:
+        return search(program, target_output, solved_nouns, solved_verbs)
+    return solve_linear(
+        expression.noun, expression.verb,
+        target_output - expression.constant, solved_nouns, solved_verbs)
+
+
+if __name__ == "__main__":
+    with open("input") as f:
+        line = f.readline().strip()
+    noun, verb = solve_noun_and_verb(
+        [int(x) for x in line.split(',')], 19690720)
+    print(100 * noun + verb)
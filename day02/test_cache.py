@@ -0,0 +1,40 @@
+from cache import OutputCache
+from runner import ProgramRunner
+
+
+# Leaves noun * verb at address 0.
+PROGRAM = [1, 0, 0, 3, 2, 1, 2, 0, 99] + [0] * 11
+
+
+def test_lru_eviction():
+    cache = OutputCache(PROGRAM, maxsize=2)
+    assert cache.get(3, 4) == 12
+    assert cache.get(3, 4) == 12
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.get(5, 5)
+    cache.get(3, 4)
+    cache.get(6, 6)
+    assert list(cache.entries) == [(3, 4), (6, 6)]
+
+
+def test_disk_storage(tmp_path):
+    path = str(tmp_path / "outputs.db")
+    with OutputCache(PROGRAM, path=path) as cache:
+        cache.warm_sweep(end=19)
+        assert len(cache.entries) == 400
+
+    with OutputCache(PROGRAM, maxsize=1, path=path) as cache:
+        cache._runner = ProgramRunner([99, 0, 0])
+        assert cache.get(7, 8) == 56
+        assert cache.get(19, 19) == 361
+
+    with OutputCache([1, 0, 0, 0, 99], path=path) as cache:
+        assert cache.get(1, 2) == 3
+
+
+def test_warm():
+    cache = OutputCache(PROGRAM)
+    cache.warm([(1, 1, -5)])
+    assert cache.get(1, 1) == -5
+    assert cache.hits == 1
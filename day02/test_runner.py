@@ -0,0 +1,28 @@
+import pytest
+
+from runner import ProgramRunner, parse_program
+
+
+def test_program_runner():
+    runner = ProgramRunner(parse_program("1,9,10,3,2,3,11,0,99,30,40,50"))
+    memory = runner.run(9, 10)
+    assert list(memory) == [3500, 9, 10, 70, 2, 3, 11, 0, 99, 30, 40, 50]
+    assert runner.output(9, 10) == 3500
+    assert runner.output(1, 1) == 100
+
+    assert runner.run(9, 10) is memory
+    assert memory.readonly
+    with pytest.raises(TypeError):
+        memory[0] = 1
+
+
+def test_wide_values():
+    runner = ProgramRunner([2, 0, 0, 0, 99, 2**40])
+    memory = runner.run(5, 5)
+    assert memory[0] == 2**80
+    assert memory.readonly
+    with pytest.raises(TypeError):
+        memory[0] = 1
+    assert runner.output(5, 5) == 2**80
+    assert runner.output(5, 5) == 2**80
+    assert runner.output(1, 2) == 2
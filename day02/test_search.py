@@ -0,0 +1,28 @@
+from itertools import product
+
+from runner import ProgramRunner
+from search import find_pair, find_pairs
+
+
+# Leaves noun * verb at address 0.
+PROGRAM = [1, 0, 0, 3, 2, 1, 2, 0, 99] + [0] * 31
+
+
+def _first_pairs(program, end):
+    runner = ProgramRunner(program)
+    table = dict()
+    for noun, verb in product(range(end + 1), range(end + 1)):
+        table.setdefault(runner.output(noun, verb), (noun, verb))
+    return table
+
+
+def test_find_pairs():
+    expected = _first_pairs(PROGRAM, 39)
+    assert find_pairs(PROGRAM, None, end=39, workers=2) == expected
+
+    targets = [12, 36, 1000, 39 * 39]
+    found = find_pairs(PROGRAM, targets, end=39, workers=2)
+    assert found == {t: expected[t] for t in targets if t in expected}
+
+    assert find_pair(PROGRAM, 12, end=39, workers=2) == (1, 12)
+    assert find_pair(PROGRAM, 37 * 38, end=39, workers=2) == (37, 38)
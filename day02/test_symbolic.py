@@ -0,0 +1,70 @@
+import os
+
+from runner import ProgramRunner
+from symbolic import execute_symbolic, search, solve_noun_and_verb
+
+
+def _read_program():
+    with open(os.path.join(os.path.dirname(__file__), "input")) as f:
+        return [int(x) for x in f.readline().strip().split(',')]
+
+
+def test_linear_program():
+    program = _read_program()
+    runner = ProgramRunner(program)
+    expression, _, _ = execute_symbolic(program, (0, 99), (0, 99))
+    assert expression is not None
+    for noun, verb in [(0, 0), (12, 2), (71, 95), (99, 99)]:
+        assert expression.evaluate(noun, verb) == runner.output(noun, verb)
+
+    for noun, verb in [(12, 2), (71, 95), (50, 0)]:
+        target = runner.output(noun, verb)
+        assert solve_noun_and_verb(program, target) == search(
+            program, target, (0, 99), (0, 99))
+    assert solve_noun_and_verb(program, 19690720) == (71, 95)
+    assert solve_noun_and_verb(program, -1) is None
+
+
+def test_wide_ranges():
+    # Leaves noun + 1000 * verb at address 0; the zero padding lets the
+    # first instruction read through nouns and verbs up to 10**5 - 1.
+    program = [1, 0, 0, 3, 2, 2, 13, 2, 1, 1, 2, 0, 99, 1000]
+    program += [0] * (10**5 - len(program))
+    expression, noun_bounds, verb_bounds = execute_symbolic(
+        program, (0, 10**6), (0, 10**6))
+    assert expression == (0, 1, 1000)
+    assert noun_bounds == verb_bounds == (0, 10**5 - 1)
+    assert solve_noun_and_verb(program, 5 + 1000 * 70000, end=10**6) == (
+        5, 70000)
+
+
+def test_non_linear_fallback():
+    program = [1, 0, 0, 3, 2, 1, 2, 0, 99]
+    expression, noun_bounds, verb_bounds = execute_symbolic(
+        program, (0, 99), (0, 99))
+    assert expression is None
+    assert noun_bounds == verb_bounds == (0, 8)
+    assert solve_noun_and_verb(program, 12) == (2, 6)
+
+
+def test_negative_addresses_wrap():
+    program = _read_program()
+    runner = ProgramRunner(program)
+    target = runner.output(-3, -4)
+    assert solve_noun_and_verb(program, target, start=-50) == search(
+        program, target, (-50, 99), (-50, 99)) == (-3, -4)
+
+    # reads address noun, which wraps for nouns down to -size
+    program = [1, 5, 0, 0, 99, -1]
+    _, noun_bounds, _ = execute_symbolic(program, (-50, 50), (0, 0))
+    assert noun_bounds == (-6, 5)
+    assert solve_noun_and_verb(program, 0, end=50, start=-50) == search(
+        program, 0, (-50, 50), (-50, 50))
+
+
+def test_failing_program():
+    # the third instruction has no room for its operands
+    program = [1, 0, 0, 0, 1, 0, 0, 0, 1, 0]
+    assert search(program, 2, (0, 9), (0, 9)) is None
+    assert solve_noun_and_verb(program, 2, end=9) is None
+    assert solve_noun_and_verb([7, 0, 0, 0, 99], 7, end=4) is None
@@ -0,0 +1,32 @@
+"""
+Compares the per-cell walk of `part2` with the NumPy rasterizer and the
+segment engine on the puzzle input.
+"""
+import time
+
+import part2
+import raster
+import segments
+
+
+def main():
+    with open("input") as fin:
+        wire1, wire2 = fin.read().strip().split('\n')
+
+    timings = []
+    for name, solve in [
+            ("part2", part2.find_distance_to_closest_intersection),
+            ("raster", raster.find_lowest_combined_delay),
+            ("segments", segments.find_lowest_combined_delay)]:
+        start = time.perf_counter()
+        answer = solve(wire1, wire2)
+        timings.append((name, answer, time.perf_counter() - start))
+
+    baseline = timings[0][2]
+    for name, answer, seconds in timings:
+        print(f"{name:<9} {answer} {seconds:.4f}s "
+              f"({baseline / seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""
+Intersection analysis for a harness of many wires.
+
+`WireIndex` parses every wire once into its first-visit pieces (see
+`segments`) and finds all shared cells of all wires in one pass: a single
+sweep over the horizontal and vertical pieces of every wire finds the
+crossings, and one more sweep along each row and column splits the pieces
+on it into runs of cells covered by the same set of wires. Only runs
+covered by two or more wires are kept, so memory depends on the number of
+segments and shared runs, never on the length of the moves, and no wire is
+walked more than once however many pairs are asked about.
+
+Within a run every wire is represented by one piece, so the delay of each
+wire is linear along the run and the lowest combined delay of any group of
+wires is at one of its ends.
+"""
+import argparse
+from collections import defaultdict
+from itertools import combinations
+from typing import (
+    DefaultDict, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple,
+)
+
+from segments import (
+    Segment, closest_to_zero, crossing_indices, first_visits, parse_wire,
+)
+
+
+Pair = Tuple[int, int]
+
+# (position, change, wire, piece) for the sweep along one row or column
+Event = Tuple[int, int, int, Optional[Segment]]
+
+
+def steps_to(piece: Segment, x: int, y: int) -> int:
+    return piece.steps_at(x if piece.horizontal else y)
+
+
+class SharedRun(NamedTuple):
+    horizontal: bool
+    fixed: int
+    lo: int
+    hi: int
+    # the piece of each wire covering the run, keyed by wire index
+    pieces: Dict[int, Segment]
+
+    def cell(self, position: int) -> Tuple[int, int]:
+        if self.horizontal:
+            return position, self.fixed
+        return self.fixed, position
+
+    def distance(self) -> int:
+        return abs(self.fixed) + abs(closest_to_zero(self.lo, self.hi))
+
+    def delay(self, wires: Optional[Iterable[int]] = None) -> int:
+        """
+        Lowest combined delay of the given wires, all wires by default, over
+        the cells of the run.
+        """
+        pieces = [self.pieces[wire] for wire in
+                  (self.pieces if wires is None else wires)]
+        return min(
+            sum(steps_to(piece, *self.cell(position)) for piece in pieces)
+            for position in {self.lo, self.hi})
+
+
+class PairResult(NamedTuple):
+    distance: float
+    delay: float
+
+
+def sweep_line(
+        horizontal: bool,
+        fixed: int,
+        events: List[Event],
+        ) -> Iterator[SharedRun]:
+    """
+    Yields the runs of the line covered by two or more wires. Events with
+    no piece block their cells instead of covering them.
+    """
+    events.sort(key=lambda event: event[0])
+    active: DefaultDict[int, List[Segment]] = defaultdict(list)
+    blocked = 0
+    for i, (position, change, wire, piece) in enumerate(events):
+        if piece is None:
+            blocked += change
+        elif change > 0:
+            active[wire].append(piece)
+        else:
+            active[wire].remove(piece)
+            if not active[wire]:
+                del active[wire]
+        if i + 1 == len(events) or events[i + 1][0] == position:
+            continue
+        if blocked or len(active) < 2:
+            continue
+        lo, hi = position, events[i + 1][0] - 1
+        pieces = dict()
+        for wire, candidates in active.items():
+            # two pieces of a wire only meet where it crosses itself, which
+            # is a single cell
+            pieces[wire] = min(candidates, key=lambda piece: steps_to(
+                piece, *((lo, fixed) if horizontal else (fixed, lo))))
+        yield SharedRun(horizontal, fixed, lo, hi, pieces)
+
+
+class WireIndex:
+    def __init__(self, wires: Iterable[str]):
+        self.pieces = [first_visits(parse_wire(wire)) for wire in wires]
+        self.runs = list(self._shared_runs())
+
+    def _shared_runs(self) -> Iterator[SharedRun]:
+        horizontals: List[Segment] = []
+        verticals: List[Segment] = []
+        horizontal_wires: List[int] = []
+        vertical_wires: List[int] = []
+        for wire, pieces in enumerate(self.pieces):
+            for piece in pieces:
+                if piece.horizontal:
+                    horizontals.append(piece)
+                    horizontal_wires.append(wire)
+                else:
+                    verticals.append(piece)
+                    vertical_wires.append(wire)
+
+        rows: DefaultDict[int, List[Event]] = defaultdict(list)
+        columns: DefaultDict[int, List[Event]] = defaultdict(list)
+        for piece, wire in zip(horizontals, horizontal_wires):
+            rows[piece.fixed] += [
+                (piece.lo, 1, wire, piece), (piece.hi + 1, -1, wire, piece)]
+        for piece, wire in zip(verticals, vertical_wires):
+            columns[piece.fixed] += [
+                (piece.lo, 1, wire, piece), (piece.hi + 1, -1, wire, piece)]
+
+        # a crossing cell is counted on its row, where the vertical piece
+        # covers a single cell, and blocked on its column
+        crossed = set()
+        for i, j in crossing_indices(horizontals, verticals):
+            h, v = horizontals[i], verticals[j]
+            if (h.fixed, j) not in crossed:
+                crossed.add((h.fixed, j))
+                rows[h.fixed] += [
+                    (v.fixed, 1, vertical_wires[j], v),
+                    (v.fixed + 1, -1, vertical_wires[j], v)]
+            columns[v.fixed] += [
+                (h.fixed, 1, -1, None), (h.fixed + 1, -1, -1, None)]
+
+        for y, events in rows.items():
+            yield from sweep_line(True, y, events)
+        for x, events in columns.items():
+            yield from sweep_line(False, x, events)
+
+    def shared(self, k: int = 2) -> Iterator[SharedRun]:
+        """
+        Yields the runs of cells crossed by at least k wires.
+        """
+        if k < 2:
+            raise ValueError("k must be at least 2")
+        return (run for run in self.runs if len(run.pieces) >= k)
+
+    def closest_intersection(self, k: int = 2) -> float:
+        return min((run.distance() for run in self.shared(k)),
+                   default=float("inf"))
+
+    def lowest_combined_delay(self, k: int = 2) -> float:
+        """
+        Lowest sum of the delays of all wires crossing a cell, over the
+        cells crossed by at least k wires.
+        """
+        return min((run.delay() for run in self.shared(k)),
+                   default=float("inf"))
+
+    def pairwise(self) -> Dict[Pair, PairResult]:
+        """
+        Maps every pair of wire indices that meet to the distance of their
+        closest intersection and their lowest combined delay.
+        """
+        distances: Dict[Pair, float] = dict()
+        delays: Dict[Pair, float] = dict()
+        for run in self.runs:
+            distance = run.distance()
+            for pair in combinations(sorted(run.pieces), 2):
+                distances[pair] = min(
+                    distances.get(pair, float("inf")), distance)
+                delays[pair] = min(
+                    delays.get(pair, float("inf")), run.delay(pair))
+        return {pair: PairResult(distances[pair], delays[pair])
+                for pair in sorted(distances)}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input_file", nargs="?", default="input")
+    parser.add_argument("-k", type=int, default=None,
+                        help="report cells crossed by at least k wires "
+                             "instead of every pair")
+    args = parser.parse_args()
+
+    with open(args.input_file) as fin:
+        index = WireIndex(fin.read().split())
+
+    if args.k is None:
+        for (i, j), result in index.pairwise().items():
+            print(i, j, result.distance, result.delay)
+    else:
+        print(index.closest_intersection(args.k),
+              index.lowest_combined_delay(args.k))
+
+
+if __name__ == "__main__":
+    main()
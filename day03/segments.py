@@ -0,0 +1,313 @@
+"""
+Segment-based wire intersection engine.
+
+Each wire is kept as its list of axis-aligned segments instead of the set
+of every grid cell it visits. A segment covers the cells of one move,
+without the cell the move starts from, so the union of a wire's segments is
+exactly the set of cells the per-cell walk in `part1` visits.
+
+Crossings between a horizontal segment of one wire and a vertical segment
+of the other are found with a sweep line over x that keeps the y
+coordinates of the active horizontal segments in a sorted list. Collinear
+overlaps are found by merging, per row and per column, the intervals of
+both wires. Time and memory depend on the number of segments only, not on
+the length of the moves.
+
+Every segment also carries the number of steps the wire has taken before
+it, so the signal delay at any of its cells is that offset plus the
+distance along the segment. For part 2, a wire is first reduced to the
+pieces of its segments that cover cells it has not visited before, by
+cutting every segment against the earlier ones on the same row or column.
+A cell can still be covered by two perpendicular pieces of the same wire
+where the wire crosses itself, but since every pair of pieces of the two
+wires is tried, the minimum over pairs there is the sum of the first-visit
+delays anyway.
+"""
+from bisect import bisect_left, insort
+from collections import defaultdict
+from typing import Dict, Iterator, List, NamedTuple, Tuple
+
+
+DIRECTIONS = {'R': (1, 0), 'L': (-1, 0), 'U': (0, 1), 'D': (0, -1)}
+
+
+class Segment(NamedTuple):
+    horizontal: bool
+    # y for horizontal segments, x for vertical ones
+    fixed: int
+    # inclusive range of covered cells along the segment
+    lo: int
+    hi: int
+    # coordinate along the segment where the move starts, and the number of
+    # steps the wire has taken when it gets there
+    start: int
+    offset: int
+
+    def steps_at(self, position: int) -> int:
+        return self.offset + abs(position - self.start)
+
+
+def parse_wire(wire: str) -> List[Segment]:
+    segments = []
+    x, y, steps = 0, 0, 0
+    for move in wire.split(','):
+        direction, distance = move[0], int(move[1:])
+        if direction not in DIRECTIONS:
+            raise ValueError
+        if distance == 0:
+            continue
+        dx, dy = DIRECTIONS[direction]
+        end_x, end_y = x + dx * distance, y + dy * distance
+        if dy == 0:
+            lo, hi = (x + 1, end_x) if dx > 0 else (end_x, x - 1)
+            segments.append(Segment(True, y, lo, hi, x, steps))
+        else:
+            lo, hi = (y + 1, end_y) if dy > 0 else (end_y, y - 1)
+            segments.append(Segment(False, x, lo, hi, y, steps))
+        x, y, steps = end_x, end_y, steps + distance
+    return segments
+
+
+assert parse_wire("R8,U5") == [
+    Segment(True, 0, 1, 8, 0, 0), Segment(False, 8, 1, 5, 0, 8)]
+assert parse_wire("L2,D3") == [
+    Segment(True, 0, -2, -1, 0, 0), Segment(False, -2, -3, -1, 0, 2)]
+
+
+def closest_to_zero(lo: int, hi: int) -> int:
+    return min(max(0, lo), hi)
+
+
+def crossings(
+        horizontals: List[Segment], verticals: List[Segment]
+        ) -> Iterator[Tuple[int, List[Tuple[int, int]]]]:
+    """
+    Sweeps over x and yields the index of each vertical segment with the
+    sorted (y, index) pairs of the horizontal segments covering its x. The
+    list is only valid until the next item is requested.
+    """
+    events = []
+    for i, h in enumerate(horizontals):
+        events.append((h.lo, 0, i))
+        events.append((h.hi, 2, i))
+    for i, v in enumerate(verticals):
+        events.append((v.fixed, 1, i))
+    events.sort()
+
+    active: List[Tuple[int, int]] = []
+    for _, kind, i in events:
+        if kind == 0:
+            insort(active, (horizontals[i].fixed, i))
+        elif kind == 2:
+            del active[bisect_left(active, (horizontals[i].fixed, i))]
+        else:
+            yield i, active
+
+
+def crossing_indices(
+        horizontals: List[Segment], verticals: List[Segment]
+        ) -> Iterator[Tuple[int, int]]:
+    """
+    Yields the indices of every (horizontal, vertical) pair of segments
+    sharing a cell.
+    """
+    for j, active in crossings(horizontals, verticals):
+        v = verticals[j]
+        first = bisect_left(active, (v.lo,))
+        last = bisect_left(active, (v.hi + 1,))
+        for _, i in active[first:last]:
+            yield i, j
+
+
+def crossing_pairs(
+        horizontals: List[Segment], verticals: List[Segment]
+        ) -> Iterator[Tuple[Segment, Segment]]:
+    """
+    Yields every (horizontal, vertical) pair of segments sharing a cell.
+    """
+    for i, j in crossing_indices(horizontals, verticals):
+        yield horizontals[i], verticals[j]
+
+
+def closest_crossing(
+        horizontals: List[Segment], verticals: List[Segment]
+        ) -> float:
+    min_dist = float("inf")
+    for j, active in crossings(horizontals, verticals):
+        v = verticals[j]
+        i = bisect_left(active, (closest_to_zero(v.lo, v.hi),))
+        for y, _ in active[max(i - 1, 0):i + 1]:
+            if v.lo <= y <= v.hi:
+                min_dist = min(min_dist, abs(v.fixed) + abs(y))
+    return min_dist
+
+
+def merge_intervals(
+        intervals: List[Tuple[int, int]]
+        ) -> List[Tuple[int, int]]:
+    merged: List[Tuple[int, int]] = []
+    for lo, hi in sorted(intervals):
+        if merged and lo <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], hi))
+        else:
+            merged.append((lo, hi))
+    return merged
+
+
+def group_lines(
+        segments: List[Segment], horizontal: bool
+        ) -> Dict[int, List[Segment]]:
+    lines: Dict[int, List[Segment]] = defaultdict(list)
+    for segment in segments:
+        if segment.horizontal == horizontal:
+            lines[segment.fixed].append(segment)
+    return lines
+
+
+def overlaps(
+        segments1: List[Segment], segments2: List[Segment]
+        ) -> Iterator[Tuple[bool, int, int, int]]:
+    """
+    Yields (horizontal, fixed, lo, hi) for every run of cells covered by
+    collinear segments of both wires.
+    """
+    for horizontal in (True, False):
+        lines1 = group_lines(segments1, horizontal)
+        lines2 = group_lines(segments2, horizontal)
+        for fixed in lines1.keys() & lines2.keys():
+            runs1 = merge_intervals([(s.lo, s.hi) for s in lines1[fixed]])
+            runs2 = merge_intervals([(s.lo, s.hi) for s in lines2[fixed]])
+            i = j = 0
+            while i < len(runs1) and j < len(runs2):
+                lo = max(runs1[i][0], runs2[j][0])
+                hi = min(runs1[i][1], runs2[j][1])
+                if lo <= hi:
+                    yield horizontal, fixed, lo, hi
+                if runs1[i][1] < runs2[j][1]:
+                    i += 1
+                else:
+                    j += 1
+
+
+def closest_intersection(
+        segments1: List[Segment], segments2: List[Segment]
+        ) -> float:
+    horizontals1 = [s for s in segments1 if s.horizontal]
+    verticals1 = [s for s in segments1 if not s.horizontal]
+    horizontals2 = [s for s in segments2 if s.horizontal]
+    verticals2 = [s for s in segments2 if not s.horizontal]
+
+    min_dist = min(
+        closest_crossing(horizontals1, verticals2),
+        closest_crossing(horizontals2, verticals1),
+    )
+    for _, fixed, lo, hi in overlaps(segments1, segments2):
+        min_dist = min(min_dist, abs(fixed) + abs(closest_to_zero(lo, hi)))
+    return min_dist
+
+
+def find_distance_to_closest_intersection(wire1: str, wire2: str) -> float:
+    return closest_intersection(parse_wire(wire1), parse_wire(wire2))
+
+
+def first_visits(segments: List[Segment]) -> List[Segment]:
+    """
+    Cuts every segment down to the pieces covering cells that no earlier
+    segment on the same row or column covers. Pieces keep the start and
+    offset of their segment, so `steps_at` still gives the delay of the
+    first visit along that line.
+    """
+    # sorted, disjoint, non-adjacent covered intervals per line
+    covered: Dict[Tuple[bool, int], List[Tuple[int, int]]] = \
+        defaultdict(list)
+    pieces = []
+    for segment in segments:
+        line = covered[segment.horizontal, segment.fixed]
+        i = bisect_left(line, (segment.lo,))
+        if i > 0 and line[i - 1][1] >= segment.lo - 1:
+            i -= 1
+        j = i
+        lo, hi = segment.lo, segment.hi
+        position = lo
+        while j < len(line) and line[j][0] <= hi + 1:
+            if position < line[j][0]:
+                pieces.append(segment._replace(
+                    lo=position, hi=min(hi, line[j][0] - 1)))
+            position = max(position, line[j][1] + 1)
+            lo, hi = min(lo, line[j][0]), max(hi, line[j][1])
+            j += 1
+        if position <= segment.hi:
+            pieces.append(segment._replace(lo=position))
+        line[i:j] = [(lo, hi)]
+    return pieces
+
+
+assert first_visits(parse_wire("R5,L3,R6")) == [
+    Segment(True, 0, 1, 5, 0, 0), Segment(True, 0, 6, 8, 2, 8)]
+assert first_visits(parse_wire("R2,U1,L4,D1,R5")) == [
+    Segment(True, 0, 1, 2, 0, 0), Segment(False, 2, 1, 1, 0, 2),
+    Segment(True, 1, -2, 1, 2, 3), Segment(False, -2, 0, 0, 1, 7),
+    Segment(True, 0, -1, 0, -2, 8), Segment(True, 0, 3, 3, -2, 8)]
+
+
+def collinear_pairs(
+        pieces1: List[Segment], pieces2: List[Segment]
+        ) -> Iterator[Tuple[Segment, Segment, int, int]]:
+    """
+    Yields (piece1, piece2, lo, hi) for every pair of collinear pieces of
+    the two wires sharing the cells lo to hi. The pieces of each wire must
+    not overlap one another, as returned by `first_visits`.
+    """
+    for horizontal in (True, False):
+        lines1 = group_lines(pieces1, horizontal)
+        lines2 = group_lines(pieces2, horizontal)
+        for fixed in lines1.keys() & lines2.keys():
+            line1 = sorted(lines1[fixed], key=lambda s: s.lo)
+            line2 = sorted(lines2[fixed], key=lambda s: s.lo)
+            i = j = 0
+            while i < len(line1) and j < len(line2):
+                lo = max(line1[i].lo, line2[j].lo)
+                hi = min(line1[i].hi, line2[j].hi)
+                if lo <= hi:
+                    yield line1[i], line2[j], lo, hi
+                if line1[i].hi < line2[j].hi:
+                    i += 1
+                else:
+                    j += 1
+
+
+def lowest_combined_delay(
+        segments1: List[Segment], segments2: List[Segment]
+        ) -> float:
+    pieces1 = first_visits(segments1)
+    pieces2 = first_visits(segments2)
+    horizontals1 = [s for s in pieces1 if s.horizontal]
+    verticals1 = [s for s in pieces1 if not s.horizontal]
+    horizontals2 = [s for s in pieces2 if s.horizontal]
+    verticals2 = [s for s in pieces2 if not s.horizontal]
+
+    min_delay = float("inf")
+    for horizontals, verticals in ((horizontals1, verticals2),
+                                   (horizontals2, verticals1)):
+        for h, v in crossing_pairs(horizontals, verticals):
+            min_delay = min(
+                min_delay, h.steps_at(v.fixed) + v.steps_at(h.fixed))
+    for s1, s2, lo, hi in collinear_pairs(pieces1, pieces2):
+        # the delay is linear along a shared run, so an end is the lowest
+        for position in (lo, hi):
+            min_delay = min(
+                min_delay, s1.steps_at(position) + s2.steps_at(position))
+    return min_delay
+
+
+def find_lowest_combined_delay(wire1: str, wire2: str) -> float:
+    return lowest_combined_delay(parse_wire(wire1), parse_wire(wire2))
+
+
+if __name__ == "__main__":
+    with open("input") as fin:
+        lines = fin.read()
+
+    wire1, wire2 = lines.strip().split('\n')
+    print(find_distance_to_closest_intersection(wire1, wire2))
+    print(find_lowest_combined_delay(wire1, wire2))
@@ -0,0 +1,87 @@
+import random
+from collections import defaultdict
+
+import pytest
+
+from harness import WireIndex
+
+
+def _first_steps(wire):
+    steps = {'R': (1, 0), 'L': (-1, 0), 'U': (0, 1), 'D': (0, -1)}
+    visited = dict()
+    x, y, count = 0, 0, 0
+    for move in wire.split(','):
+        dx, dy = steps[move[0]]
+        for _ in range(int(move[1:])):
+            x, y, count = x + dx, y + dy, count + 1
+            visited.setdefault((x, y), count)
+    return visited
+
+
+def _random_wire(rng, moves, max_distance):
+    return ','.join(
+        rng.choice("RLUD") + str(rng.randint(0, max_distance))
+        for _ in range(moves))
+
+
+def _cells(wires):
+    cells = defaultdict(dict)
+    for i, wire in enumerate(wires):
+        for cell, steps in _first_steps(wire).items():
+            cells[cell][i] = steps
+    return cells
+
+
+def test_pair_matches_two_wire_answers():
+    index = WireIndex([
+        "R75,D30,R83,U83,L12,D49,R71,U7,L72",
+        "U62,R66,U55,R34,D71,R55,D58,R83",
+        "R98,U47,R26,D63,R33,U87,L62,D20,R33,U53,R51",
+        "U98,R91,D20,R16,D67,R40,U7,R15,U6,R7",
+    ])
+    pairs = index.pairwise()
+    assert pairs[0, 1] == (159, 610)
+    assert pairs[2, 3] == (135, 410)
+
+
+def test_pairwise_matches_cell_walk():
+    rng = random.Random(6)
+    for _ in range(100):
+        wires = [_random_wire(rng, rng.randint(1, 10), 6)
+                 for _ in range(rng.randint(2, 5))]
+        expected = dict()
+        cells = _cells(wires)
+        for i in range(len(wires)):
+            for j in range(i + 1, len(wires)):
+                common = [(cell, visits) for cell, visits in cells.items()
+                          if i in visits and j in visits]
+                if common:
+                    expected[i, j] = (
+                        min(abs(x) + abs(y) for (x, y), _ in common),
+                        min(v[i] + v[j] for _, v in common))
+        assert WireIndex(wires).pairwise() == expected, wires
+
+
+def test_k_wire_queries_match_cell_walk():
+    rng = random.Random(7)
+    for _ in range(100):
+        wires = [_random_wire(rng, rng.randint(1, 10), 5)
+                 for _ in range(rng.randint(2, 6))]
+        index = WireIndex(wires)
+        cells = _cells(wires)
+        for k in range(2, len(wires) + 1):
+            shared = [(cell, visits) for cell, visits in cells.items()
+                      if len(visits) >= k]
+            assert index.closest_intersection(k) == min(
+                (abs(x) + abs(y) for (x, y), _ in shared),
+                default=float("inf")), wires
+            assert index.lowest_combined_delay(k) == min(
+                (sum(v.values()) for _, v in shared),
+                default=float("inf")), wires
+            assert sum(run.hi - run.lo + 1 for run in index.shared(k)) == \
+                len(shared), wires
+
+
+def test_k_must_be_at_least_two():
+    with pytest.raises(ValueError):
+        list(WireIndex(["R1", "U1"]).shared(1))
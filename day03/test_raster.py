@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from raster import (  # noqa: E402
+    find_distance_to_closest_intersection, find_lowest_combined_delay,
+    pack, unpack,
+)
+from segments import (  # noqa: E402
+    find_distance_to_closest_intersection as segment_distance,
+    find_lowest_combined_delay as segment_delay,
+)
+
+
+def _random_wire(rng, moves, max_distance):
+    return ','.join(
+        rng.choice("RLUD") + str(rng.randint(0, max_distance))
+        for _ in range(moves))
+
+
+def test_examples():
+    wire1 = "R8,U5,L5,D3"
+    wire2 = "U7,R6,D4,L4"
+    assert find_distance_to_closest_intersection(wire1, wire2) == 6
+    assert find_lowest_combined_delay(wire1, wire2) == 30
+
+    wire1 = "R75,D30,R83,U83,L12,D49,R71,U7,L72"
+    wire2 = "U62,R66,U55,R34,D71,R55,D58,R83"
+    assert find_distance_to_closest_intersection(wire1, wire2) == 159
+    assert find_lowest_combined_delay(wire1, wire2) == 610
+
+    wire1 = "R98,U47,R26,D63,R33,U87,L62,D20,R33,U53,R51"
+    wire2 = "U98,R91,D20,R16,D67,R40,U7,R15,U6,R7"
+    assert find_distance_to_closest_intersection(wire1, wire2) == 135
+    assert find_lowest_combined_delay(wire1, wire2) == 410
+
+
+def test_pack_round_trip():
+    xs = np.array([0, -1, 5, -(1 << 31) + 1, (1 << 31) - 1])
+    ys = np.array([0, 7, -3, (1 << 31) - 1, -(1 << 31)])
+    keys = pack(xs, ys)
+    assert len(set(keys.tolist())) == len(keys)
+    unpacked_xs, unpacked_ys = unpack(keys)
+    assert unpacked_xs.tolist() == xs.tolist()
+    assert unpacked_ys.tolist() == ys.tolist()
+
+
+def test_matches_segments():
+    rng = random.Random(8)
+    for _ in range(200):
+        wire1 = _random_wire(rng, rng.randint(1, 12), 8)
+        wire2 = _random_wire(rng, rng.randint(1, 12), 8)
+        assert find_distance_to_closest_intersection(wire1, wire2) == \
+            segment_distance(wire1, wire2), (wire1, wire2)
+        assert find_lowest_combined_delay(wire1, wire2) == \
+            segment_delay(wire1, wire2), (wire1, wire2)
+
+
+def test_invalid_direction():
+    with pytest.raises(ValueError):
+        find_distance_to_closest_intersection("R1,X2", "U1")
@@ -0,0 +1,116 @@
+import random
+
+from segments import (
+    find_distance_to_closest_intersection, find_lowest_combined_delay,
+    first_visits, parse_wire)
+
+
+def _walk(wire):
+    steps = {'R': (1, 0), 'L': (-1, 0), 'U': (0, 1), 'D': (0, -1)}
+    x, y = 0, 0
+    for move in wire.split(','):
+        dx, dy = steps[move[0]]
+        for _ in range(int(move[1:])):
+            x, y = x + dx, y + dy
+            yield x, y
+
+
+def _first_steps(wire):
+    visited = dict()
+    for steps, cell in enumerate(_walk(wire), 1):
+        visited.setdefault(cell, steps)
+    return visited
+
+
+def _brute_force(wire1, wire2):
+    common = set(_walk(wire1)) & set(_walk(wire2))
+    return min((abs(x) + abs(y) for x, y in common), default=float("inf"))
+
+
+def _brute_force_delay(wire1, wire2):
+    visited1 = _first_steps(wire1)
+    visited2 = _first_steps(wire2)
+    return min((visited1[cell] + visited2[cell]
+                for cell in visited1.keys() & visited2.keys()),
+               default=float("inf"))
+
+
+def _cells(pieces):
+    for piece in pieces:
+        for position in range(piece.lo, piece.hi + 1):
+            if piece.horizontal:
+                yield (position, piece.fixed), piece.steps_at(position)
+            else:
+                yield (piece.fixed, position), piece.steps_at(position)
+
+
+def _random_wire(rng, moves, max_distance):
+    return ','.join(
+        rng.choice("RLUD") + str(rng.randint(0, max_distance))
+        for _ in range(moves))
+
+
+def test_find_distance_to_closest_intersection():
+    wire1 = "R8,U5,L5,D3"
+    wire2 = "U7,R6,D4,L4"
+    assert find_distance_to_closest_intersection(wire1, wire2) == 6
+
+    wire1 = "R75,D30,R83,U83,L12,D49,R71,U7,L72"
+    wire2 = "U62,R66,U55,R34,D71,R55,D58,R83"
+    assert find_distance_to_closest_intersection(wire1, wire2) == 159
+
+    wire1 = "R98,U47,R26,D63,R33,U87,L62,D20,R33,U53,R51"
+    wire2 = "U98,R91,D20,R16,D67,R40,U7,R15,U6,R7"
+    assert find_distance_to_closest_intersection(wire1, wire2) == 135
+
+
+def test_matches_cell_walk():
+    rng = random.Random(3)
+    for _ in range(300):
+        wire1 = _random_wire(rng, rng.randint(1, 12), 8)
+        wire2 = _random_wire(rng, rng.randint(1, 12), 8)
+        assert find_distance_to_closest_intersection(wire1, wire2) == \
+            _brute_force(wire1, wire2), (wire1, wire2)
+
+
+def test_long_moves():
+    wire1 = "R10000000,U10000000"
+    wire2 = "U5000000,R20000000"
+    assert find_distance_to_closest_intersection(wire1, wire2) == 15000000
+
+
+def test_find_lowest_combined_delay():
+    wire1 = "R8,U5,L5,D3"
+    wire2 = "U7,R6,D4,L4"
+    assert find_lowest_combined_delay(wire1, wire2) == 30
+
+    wire1 = "R75,D30,R83,U83,L12,D49,R71,U7,L72"
+    wire2 = "U62,R66,U55,R34,D71,R55,D58,R83"
+    assert find_lowest_combined_delay(wire1, wire2) == 610
+
+    wire1 = "R98,U47,R26,D63,R33,U87,L62,D20,R33,U53,R51"
+    wire2 = "U98,R91,D20,R16,D67,R40,U7,R15,U6,R7"
+    assert find_lowest_combined_delay(wire1, wire2) == 410
+
+
+def test_first_visits_cover_each_line_cell_once():
+    rng = random.Random(5)
+    for _ in range(200):
+        wire = _random_wire(rng, rng.randint(1, 15), 6)
+        first = _first_steps(wire)
+        seen = dict()
+        for cell, steps in _cells(first_visits(parse_wire(wire))):
+            seen.setdefault(cell, []).append(steps)
+        assert seen.keys() == first.keys(), wire
+        for cell, steps in seen.items():
+            # a cell only appears twice where the wire crosses itself
+            assert len(steps) <= 2 and min(steps) == first[cell], wire
+
+
+def test_delay_matches_cell_walk():
+    rng = random.Random(4)
+    for _ in range(300):
+        wire1 = _random_wire(rng, rng.randint(1, 12), 8)
+        wire2 = _random_wire(rng, rng.randint(1, 12), 8)
+        assert find_lowest_combined_delay(wire1, wire2) == \
+            _brute_force_delay(wire1, wire2), (wire1, wire2)
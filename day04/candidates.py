@@ -0,0 +1,99 @@
+"""
+Enumeration of password candidates with non-decreasing digits.
+
+Instead of testing every integer in the range, only the digit sequences
+that never decrease are generated, digit by digit, with the bounds of the
+range cutting off whole subtrees as soon as a prefix leaves them. Among
+six-digit numbers only 3003 have non-decreasing digits, so the adjacency
+rules run on those alone. Works for numbers of any length.
+"""
+from itertools import groupby
+from typing import Callable, Iterator, List, Sequence
+
+
+Digits = Sequence[int]
+
+
+def has_double(digits: Digits) -> bool:
+    return any(a == b for a, b in zip(digits, digits[1:]))
+
+
+def has_exact_double(digits: Digits) -> bool:
+    return any(len(list(run)) == 2 for _, run in groupby(digits))
+
+
+assert has_double((1, 1, 1, 1, 1, 1)) is True
+assert has_double((1, 2, 3, 7, 8, 9)) is False
+assert has_exact_double((1, 1, 2, 2, 3, 3)) is True
+assert has_exact_double((1, 2, 3, 4, 4, 4)) is False
+assert has_exact_double((1, 1, 1, 1, 2, 2)) is True
+
+
+def to_digits(n: int, length: int) -> List[int]:
+    return [int(c) for c in str(n).zfill(length)]
+
+
+def non_decreasing_digits(lo: int, hi: int, length: int) -> Iterator[Digits]:
+    """
+    Yields, in increasing order, the digits of the numbers in [lo, hi] with
+    exactly `length` digits that never decrease.
+    """
+    low = to_digits(lo, length)
+    high = to_digits(hi, length)
+    digits = [0] * length
+
+    def _fill(position, smallest, tight_low, tight_high):
+        if position == length:
+            yield tuple(digits)
+            return
+        first = max(smallest, low[position]) if tight_low else smallest
+        last = high[position] if tight_high else 9
+        for digit in range(first, last + 1):
+            digits[position] = digit
+            yield from _fill(
+                position + 1,
+                digit,
+                tight_low and digit == low[position],
+                tight_high and digit == high[position],
+            )
+
+    # a leading zero is only allowed for the number 0 itself
+    smallest = 0 if length == 1 else 1
+    yield from _fill(0, smallest, True, True)
+
+
+def non_decreasing(start: int, end: int) -> Iterator[Digits]:
+    """
+    Yields, in increasing order, the digits of every number in [start, end]
+    whose digits never decrease.
+    """
+    start = max(start, 0)
+    if start > end:
+        return
+    for length in range(len(str(start)), len(str(end)) + 1):
+        lo = max(start, 10**(length - 1) if length > 1 else 0)
+        hi = min(end, 10**length - 1)
+        yield from non_decreasing_digits(lo, hi, length)
+
+
+def passwords(
+        start: int,
+        end: int,
+        rule: Callable[[Digits], bool] = has_double,
+        ) -> Iterator[int]:
+    for digits in non_decreasing(start, end):
+        if rule(digits):
+            yield int(''.join(map(str, digits)))
+
+
+def find_enumerated(
+        start: int,
+        end: int,
+        rule: Callable[[Digits], bool] = has_double,
+        ) -> int:
+    return sum(1 for digits in non_decreasing(start, end) if rule(digits))
+
+
+if __name__ == "__main__":
+    print(find_enumerated(372304, 847060))
+    print(find_enumerated(372304, 847060, has_exact_double))
@@ -0,0 +1,78 @@
+"""
+Digit dynamic-programming counter for the password criteria.
+
+`count_passwords` counts the numbers in [start, end] whose digits never
+decrease and that contain a double (part 1) or a run of exactly two equal
+digits (part 2), without looking at the numbers one by one. The count is
+built digit by digit from the state (position, last digit, length of the
+current run, whether a qualifying run was closed already, whether the
+prefix is still equal to the upper bound). Counts for states off the bound
+are memoized, so a range of any length costs a few thousand state
+evaluations per digit.
+
+Numbers of every length in the range are counted, unlike
+`find_brute_force`, which only looks at six-digit numbers.
+"""
+from functools import lru_cache
+
+
+def _count_up_to(n: int, exact: bool) -> int:
+    """
+    Counts the passwords in [1, n].
+    """
+    if n <= 0:
+        return 0
+    bound = [int(c) for c in str(n)]
+    length = len(bound)
+    # runs only matter up to three: a run of three or more is never a pair
+    cap = 3 if exact else 2
+
+    def _qualifies(run: int) -> bool:
+        return run == 2 if exact else run >= 2
+
+    @lru_cache(maxsize=None)
+    def _count(position: int, last: int, run: int, found: bool,
+               tight: bool) -> int:
+        if position == length:
+            return int(found or _qualifies(run))
+        total = 0
+        top = bound[position] if tight else 9
+        for digit in range(last, top + 1):
+            if digit == last:
+                next_run, next_found = min(run + 1, cap), found
+            else:
+                next_run, next_found = 1, found or _qualifies(run)
+            total += _count(position + 1, digit, next_run, next_found,
+                            tight and digit == top)
+        return total
+
+    # shorter numbers are counted with the bound lifted, starting from the
+    # first digit; a leading zero never appears since digits start at 1
+    total = 0
+    for start in range(length):
+        tight = start == 0
+        top = bound[0] if tight else 9
+        for digit in range(1, top + 1):
+            total += _count(start + 1, digit, 1, False,
+                            tight and digit == top)
+    return total
+
+
+def count_passwords(start: int, end: int, exact: bool = False) -> int:
+    """
+    Counts the numbers in [start, end] meeting the part 1 criteria, or the
+    part 2 criteria with `exact` set.
+    """
+    start = max(start, 1)
+    if start > end:
+        return 0
+    return _count_up_to(end, exact) - _count_up_to(start - 1, exact)
+
+
+assert count_passwords(372304, 847060) == 475
+assert count_passwords(372304, 847060, exact=True) == 297
+
+
+if __name__ == "__main__":
+    print(count_passwords(372304, 847060))
+    print(count_passwords(372304, 847060, exact=True))
@@ -17,8 +17,10 @@ following are now true:
 How many different passwords within the range given in your puzzle input meet
 all of the criteria?
 """
+import argparse
 from collections import Counter
 import part1
+from scan import print_progress, scan_range
 
 
 def meets_criteria(n: int) -> bool:
@@ -43,5 +45,20 @@ def find_brute_force(start: int, end: int) -> int:
     return count
 
 
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("start", type=int, nargs="?", default=372304)
+    parser.add_argument("end", type=int, nargs="?", default=847060)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+    if args.workers > 1:
+        result = scan_range(
+            max(args.start, 10**5), min(args.end, 10**6 - 1),
+            meets_criteria, workers=args.workers, progress=print_progress)
+        print(result.count)
+    else:
+        print(find_brute_force(args.start, args.end))
+
+
 if __name__ == "__main__":
-    print(find_brute_force(372304, 847060))
+    main()
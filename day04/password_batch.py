@@ -0,0 +1,133 @@
+"""
+Vectorized password checks over whole ranges.
+
+A chunk of consecutive candidates is split into a digit matrix, one row per
+number and one column per digit, with integer division and modulo, and the
+criteria are evaluated as array operations along the digit axis instead of
+with `str()` and `Counter` per number. Ranges are processed in chunks of at
+most `chunk_size` numbers, and a chunk never mixes numbers of different
+lengths, so no row carries leading zeros.
+
+Criteria are plain functions from a digit matrix to a boolean mask, so new
+rules can be tried without writing an enumerator for them.
+"""
+from typing import Callable, Iterator, Optional
+
+import numpy as np
+
+
+DEFAULT_CHUNK_SIZE = 1 << 18
+
+# 10**18 is the largest power of ten in an int64
+MAX_DIGITS = 18
+
+Criteria = Callable[[np.ndarray], np.ndarray]
+
+
+def digit_matrix(values: np.ndarray, length: int) -> np.ndarray:
+    powers = 10 ** np.arange(length - 1, -1, -1, dtype=np.int64)
+    return (values[:, None] // powers % 10).astype(np.int8)
+
+
+def run_lengths(digits: np.ndarray) -> np.ndarray:
+    """
+    Returns the length of the run of equal digits ending at each digit.
+    """
+    runs = np.ones(digits.shape, dtype=np.int8)
+    equal = digits[:, 1:] == digits[:, :-1]
+    for j in range(1, digits.shape[1]):
+        runs[:, j] = np.where(equal[:, j - 1], runs[:, j - 1] + 1, 1)
+    return runs
+
+
+def non_decreasing(digits: np.ndarray) -> np.ndarray:
+    return (np.diff(digits, axis=1) >= 0).all(axis=1)
+
+
+def has_run(
+        digits: np.ndarray, min_length: int, max_length: Optional[int] = None
+        ) -> np.ndarray:
+    """
+    Marks the rows with a complete run of equal digits at least
+    `min_length` and at most `max_length` long.
+    """
+    runs = run_lengths(digits)
+    # a run is complete where the next digit differs
+    ends = np.ones(digits.shape, dtype=bool)
+    ends[:, :-1] = digits[:, 1:] != digits[:, :-1]
+    qualifies = ends & (runs >= min_length)
+    if max_length is not None:
+        qualifies &= runs <= max_length
+    return qualifies.any(axis=1)
+
+
+def meets_criteria_batch(digits: np.ndarray) -> np.ndarray:
+    return non_decreasing(digits) & (np.diff(digits, axis=1) == 0).any(axis=1)
+
+
+def meets_exact_criteria_batch(digits: np.ndarray) -> np.ndarray:
+    # run lengths are only worked out for the few non-decreasing rows
+    mask = non_decreasing(digits)
+    mask[mask] = has_run(digits[mask], 2, 2)
+    return mask
+
+
+def chunks(
+        start: int, end: int, chunk_size: int = DEFAULT_CHUNK_SIZE
+        ) -> Iterator[np.ndarray]:
+    """
+    Yields [start, end] as arrays of at most `chunk_size` consecutive
+    numbers of the same length.
+    """
+    start = max(start, 0)
+    while start <= end:
+        length = len(str(start))
+        if length > MAX_DIGITS:
+            raise ValueError("numbers must have at most 18 digits")
+        stop = min(end + 1, 10**length, start + chunk_size)
+        yield np.arange(start, stop, dtype=np.int64)
+        start = stop
+
+
+def _masks(start, end, criteria, chunk_size):
+    for values in chunks(start, end, chunk_size):
+        length = len(str(int(values[0])))
+        yield values, criteria(digit_matrix(values, length))
+
+
+def count_batch(
+        start: int,
+        end: int,
+        criteria: Criteria = meets_criteria_batch,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        ) -> int:
+    return sum(int(np.count_nonzero(mask))
+               for _, mask in _masks(start, end, criteria, chunk_size))
+
+
+def find_batch(
+        start: int,
+        end: int,
+        criteria: Criteria = meets_criteria_batch,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        ) -> np.ndarray:
+    matches = [values[mask]
+               for values, mask in _masks(start, end, criteria, chunk_size)]
+    if not matches:
+        return np.empty(0, dtype=np.int64)
+    return np.concatenate(matches)
+
+
+def find_brute_force(
+        start: int, end: int, criteria: Criteria = meets_criteria_batch
+        ) -> int:
+    """
+    Same count as `find_brute_force` in part1 and part2, six-digit numbers
+    only.
+    """
+    return count_batch(max(start, 10**5), min(end, 10**6 - 1), criteria)
+
+
+if __name__ == "__main__":
+    print(find_brute_force(372304, 847060))
+    print(find_brute_force(372304, 847060, meets_exact_criteria_batch))
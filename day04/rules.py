@@ -0,0 +1,230 @@
+"""
+Password rules as small state machines, combined into one automaton.
+
+Every rule reads the digits of a candidate from left to right and keeps a
+small hashable state: `start` is the state before the first digit, `step`
+returns the state after a digit or None once the candidate can no longer
+pass, and `accepts` tells whether the candidate passes when it ends in that
+state. A rule must only ever reach finitely many states.
+
+`Automaton` compiles a list of rules into the product DFA, as a transition
+table over numbered states, so checking a candidate is one scan over its
+digits however many rules there are. The same table drives `count`, a digit
+DP over the table that never looks at the numbers one by one, and
+`matching`, which enumerates the passing numbers and prunes every prefix
+from which no passing number can be reached.
+"""
+from typing import (
+    Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple,
+)
+
+
+State = Hashable
+
+DEAD = -1
+
+
+class Rule:
+    start: State = None
+
+    def step(self, state: State, digit: int) -> Optional[State]:
+        raise NotImplementedError
+
+    def accepts(self, state: State) -> bool:
+        return True
+
+
+class NonDecreasing(Rule):
+    start = -1
+
+    def step(self, state: State, digit: int) -> Optional[State]:
+        return None if digit < state else digit
+
+
+class HasRun(Rule):
+    """
+    Passes when some run of equal adjacent digits is at least `min_length`
+    and at most `max_length` long.
+    """
+    def __init__(self, min_length: int = 2, max_length: Optional[int] = None):
+        self.min_length = min_length
+        self.max_length = max_length
+        # runs longer than this all behave the same
+        self.cap = (min_length if max_length is None else max_length) + 1
+        self.start = (-1, 0, False)
+
+    def _qualifies(self, run: int) -> bool:
+        return run >= self.min_length and (
+            self.max_length is None or run <= self.max_length)
+
+    def step(self, state: State, digit: int) -> Optional[State]:
+        last, run, found = state
+        if digit == last:
+            return last, min(run + 1, self.cap), found
+        return digit, 1, found or self._qualifies(run)
+
+    def accepts(self, state: State) -> bool:
+        _, run, found = state
+        return found or self._qualifies(run)
+
+
+class ForbiddenDigits(Rule):
+    def __init__(self, digits: Iterable[int]):
+        self.digits = frozenset(digits)
+
+    def step(self, state: State, digit: int) -> Optional[State]:
+        return None if digit in self.digits else state
+
+
+PART1 = (NonDecreasing(), HasRun(2))
+PART2 = (NonDecreasing(), HasRun(2, 2))
+
+
+class Automaton:
+    def __init__(self, rules: Sequence[Rule]):
+        self.rules = tuple(rules)
+        start = tuple(rule.start for rule in self.rules)
+        index = {start: 0}
+        states = [start]
+        self.table: List[List[int]] = []
+        self.accepting: List[bool] = []
+        for state in states:
+            row = []
+            for digit in range(10):
+                following = self._step(state, digit)
+                if following is None:
+                    row.append(DEAD)
+                    continue
+                if following not in index:
+                    index[following] = len(states)
+                    states.append(following)
+                row.append(index[following])
+            self.table.append(row)
+            self.accepting.append(all(
+                rule.accepts(part) for rule, part in zip(self.rules, state)))
+        self.start = 0
+        # kept as a plain dict so automata can be sent to worker processes
+        self._memo: Dict[Tuple[int, int], int] = dict()
+
+    def _step(self, state: tuple, digit: int) -> Optional[tuple]:
+        following = []
+        for rule, part in zip(self.rules, state):
+            part = rule.step(part, digit)
+            if part is None:
+                return None
+            following.append(part)
+        return tuple(following)
+
+    def run(self, digits: Iterable[int], state: int = 0) -> int:
+        table = self.table
+        for digit in digits:
+            state = table[state][digit]
+            if state == DEAD:
+                break
+        return state
+
+    def matches(self, n: int) -> bool:
+        state = self.run(int(c) for c in str(n))
+        return state != DEAD and self.accepting[state]
+
+    def _completions(self, state: int, length: int) -> int:
+        """
+        Counts the digit strings of the given length taking the automaton
+        from `state` to an accepting state.
+        """
+        if state == DEAD:
+            return 0
+        if length == 0:
+            return int(self.accepting[state])
+        count = self._memo.get((state, length))
+        if count is None:
+            count = sum(self._completions(following, length - 1)
+                        for following in self.table[state])
+            self._memo[state, length] = count
+        return count
+
+    def _count_up_to(self, n: int) -> int:
+        """
+        Counts the passing numbers in [1, n].
+        """
+        if n <= 0:
+            return 0
+        bound = [int(c) for c in str(n)]
+        length = len(bound)
+        total = 0
+        for shorter in range(1, length):
+            for digit in range(1, 10):
+                total += self._completions(
+                    self.table[self.start][digit], shorter - 1)
+        state = self.start
+        for position, top in enumerate(bound):
+            for digit in range(1 if position == 0 else 0, top):
+                total += self._completions(
+                    self.table[state][digit], length - position - 1)
+            state = self.table[state][top]
+            if state == DEAD:
+                return total
+        return total + int(self.accepting[state])
+
+    def count(self, start: int, end: int) -> int:
+        """
+        Counts the numbers in [start, end] passing every rule.
+        """
+        start = max(start, 0)
+        if start > end:
+            return 0
+        total = self._count_up_to(end) - self._count_up_to(start - 1)
+        return total + int(start == 0 and self.matches(0))
+
+    def matching(self, start: int, end: int) -> Iterator[int]:
+        """
+        Yields, in increasing order, the numbers in [start, end] passing
+        every rule.
+        """
+        start = max(start, 0)
+        if start > end:
+            return
+        if start == 0 and self.matches(0):
+            yield 0
+        for length in range(len(str(max(start, 1))), len(str(end)) + 1):
+            lo = max(start, 10**(length - 1))
+            hi = min(end, 10**length - 1)
+            if lo <= hi:
+                yield from self._matching(lo, hi, length)
+
+    def _matching(self, lo: int, hi: int, length: int) -> Iterator[int]:
+        low = [int(c) for c in str(lo)]
+        high = [int(c) for c in str(hi)]
+
+        def _fill(position, state, prefix, tight_low, tight_high):
+            if position == length:
+                yield prefix
+                return
+            first = low[position] if tight_low else 0
+            last = high[position] if tight_high else 9
+            for digit in range(first, last + 1):
+                following = self.table[state][digit]
+                if self._completions(following, length - position - 1) == 0:
+                    continue
+                yield from _fill(
+                    position + 1,
+                    following,
+                    prefix * 10 + digit,
+                    tight_low and digit == low[position],
+                    tight_high and digit == high[position],
+                )
+
+        yield from _fill(0, self.start, 0, True, True)
+
+
+assert Automaton(PART1).matches(111111) is True
+assert Automaton(PART1).matches(223450) is False
+assert Automaton(PART1).matches(123789) is False
+assert Automaton(PART2).matches(112233) is True
+assert Automaton(PART2).matches(123444) is False
+assert Automaton(PART2).matches(111122) is True
+
+
+if __name__ == "__main__":
+    print(Automaton(PART1).count(372304, 847060))
+    print(Automaton(PART2).count(372304, 847060))
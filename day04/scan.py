@@ -0,0 +1,161 @@
+"""
+Parallel chunked scan of a password range.
+
+[start, end] is cut into chunks that are checked in a process pool, either
+number by number with any picklable predicate, such as `part1.meets_criteria`
+or `rules.Automaton(...).matches`, or a whole chunk at a time with a
+`password_batch` criteria function. Each task returns its count and, when
+asked, its matches; counts are added up and matches concatenated in chunk
+order, so they come out sorted. A progress callback sees every finished
+chunk.
+
+This is for rules with no counter of their own; `digit_dp` and
+`rules.Automaton.count` count the puzzle rules without scanning at all.
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Iterator, List, NamedTuple, Optional, Tuple
+
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+Progress = Callable[[int, int, float], None]
+
+
+class ScanResult(NamedTuple):
+    count: int
+    matches: Optional[List[int]]
+    numbers: int
+    seconds: float
+
+    @property
+    def numbers_per_second(self) -> float:
+        return self.numbers / self.seconds if self.seconds else float("inf")
+
+
+def split_range(
+        start: int, end: int, chunk_size: int
+        ) -> List[Tuple[int, int]]:
+    return [(lo, min(lo + chunk_size - 1, end))
+            for lo in range(start, end + 1, chunk_size)]
+
+
+def scan_chunk(
+        validator: Callable,
+        batch: bool,
+        lo: int,
+        hi: int,
+        collect: bool,
+        ) -> Tuple[int, Optional[List[int]]]:
+    if batch:
+        from password_batch import find_batch
+
+        matches = find_batch(lo, hi, validator, hi - lo + 1).tolist()
+    else:
+        matches = [n for n in range(lo, hi + 1) if validator(n)]
+    return len(matches), matches if collect else None
+
+
+def _scan_chunks(
+        validator, batch, chunks, collect, workers
+        ) -> Iterator[Tuple[int, Tuple[int, Optional[List[int]]]]]:
+    if workers <= 1:
+        for i, (lo, hi) in enumerate(chunks):
+            yield i, scan_chunk(validator, batch, lo, hi, collect)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(scan_chunk, validator, batch, lo, hi, collect): i
+            for i, (lo, hi) in enumerate(chunks)
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def scan_range(
+        start: int,
+        end: int,
+        validator: Callable,
+        batch: bool = False,
+        workers: int = 1,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        collect: bool = False,
+        progress: Optional[Progress] = None,
+        ) -> ScanResult:
+    """
+    Counts the numbers in [start, end] passing `validator`, and lists them
+    too with `collect` set. With `batch` set, `validator` is a
+    `password_batch` criteria function instead of a predicate on numbers.
+    `progress` is called with the numbers done, the numbers in the range
+    and the seconds elapsed after every chunk.
+    """
+    begin = time.perf_counter()
+    start = max(start, 0)
+    chunks = split_range(start, end, chunk_size)
+    total = max(end - start + 1, 0)
+    count, done = 0, 0
+    matches: List[Optional[List[int]]] = [None] * len(chunks)
+    for i, (chunk_count, chunk_matches) in _scan_chunks(
+            validator, batch, chunks, collect, workers):
+        count += chunk_count
+        matches[i] = chunk_matches
+        lo, hi = chunks[i]
+        done += hi - lo + 1
+        if progress is not None:
+            progress(done, total, time.perf_counter() - begin)
+    merged = None
+    if collect:
+        merged = [n for chunk_matches in matches for n in chunk_matches]
+    return ScanResult(count, merged, total, time.perf_counter() - begin)
+
+
+def print_progress(done: int, total: int, seconds: float) -> None:
+    rate = done / seconds if seconds else 0.0
+    print(f"\r{done:,}/{total:,} ({rate:,.0f} numbers/s)", end="",
+          file=sys.stderr, flush=True)
+    if done == total:
+        print(file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("start", type=int, nargs="?", default=372304)
+    parser.add_argument("end", type=int, nargs="?", default=847060)
+    parser.add_argument("--part", type=int, choices=(1, 2), default=1)
+    parser.add_argument("--validator", choices=("automaton", "numpy"),
+                        default="automaton")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--matches", action="store_true")
+    args = parser.parse_args()
+
+    if args.validator == "numpy":
+        import password_batch
+
+        validator = (password_batch.meets_criteria_batch if args.part == 1
+                     else password_batch.meets_exact_criteria_batch)
+    else:
+        from rules import PART1, PART2, Automaton
+
+        validator = Automaton(PART1 if args.part == 1 else PART2).matches
+
+    result = scan_range(
+        args.start, args.end, validator,
+        batch=args.validator == "numpy",
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        collect=args.matches,
+        progress=print_progress,
+    )
+    if result.matches is not None:
+        for n in result.matches:
+            print(n)
+    print(result.count)
+    print(f"{result.numbers:,} numbers in {result.seconds:.3f}s "
+          f"({result.numbers_per_second:,.0f} numbers/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import random
+
+from candidates import (
+    find_enumerated, has_double, has_exact_double, non_decreasing, passwords,
+)
+
+
+def _is_non_decreasing(n):
+    s = str(n)
+    return all(a <= b for a, b in zip(s, s[1:]))
+
+
+def _brute_force(start, end, rule):
+    return [n for n in range(max(start, 0), end + 1)
+            if _is_non_decreasing(n) and rule([int(c) for c in str(n)])]
+
+
+def test_counts_six_digit_non_decreasing():
+    assert sum(1 for _ in non_decreasing(10**5, 10**6 - 1)) == 3003
+
+
+def test_puzzle_range():
+    assert find_enumerated(372304, 847060) == 475
+    assert find_enumerated(372304, 847060, has_exact_double) == 297
+
+
+def test_matches_brute_force():
+    rng = random.Random(9)
+    for _ in range(200):
+        start = rng.randint(-5, 20000)
+        end = start + rng.randint(-5, 5000)
+        for rule in (has_double, has_exact_double):
+            assert list(passwords(start, end, rule)) == \
+                _brute_force(start, end, rule), (start, end)
+
+
+def test_any_length():
+    assert list(passwords(0, 11)) == [11]
+    assert list(passwords(5, 5, lambda digits: True)) == [5]
+    # all C(18, 8) non-decreasing ten-digit numbers repeat a digit
+    assert find_enumerated(10**9, 10**10 - 1) == 43758
+    assert next(passwords(10**17, 10**18 - 1)) == 111111111111111111
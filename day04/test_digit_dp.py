@@ -0,0 +1,54 @@
+import random
+from collections import Counter
+
+from candidates import find_enumerated, has_double, has_exact_double
+from digit_dp import count_passwords
+
+
+def _meets_criteria(n, exact):
+    s = str(n)
+    if any(a > b for a, b in zip(s, s[1:])):
+        return False
+    if exact:
+        return 2 in Counter(s).values()
+    return any(a == b for a, b in zip(s, s[1:]))
+
+
+def _find_brute_force(start, end, exact):
+    # same six-digit clamp as find_brute_force in part1 and part2
+    return sum(1 for n in range(max(start, 10**5), min(end + 1, 10**6))
+               if _meets_criteria(n, exact))
+
+
+def test_matches_brute_force_on_six_digit_ranges():
+    rng = random.Random(10)
+    ranges = [(10**5, 10**6 - 1), (111111, 111111), (111122, 111122),
+              (123444, 123444)]
+    for _ in range(20):
+        start = rng.randint(10**5, 10**6 - 1)
+        ranges.append((start, start + rng.randint(0, 20000)))
+    for start, end in ranges:
+        for exact in (False, True):
+            assert count_passwords(start, end, exact) == \
+                _find_brute_force(start, end, exact), (start, end, exact)
+
+
+def test_matches_enumeration_across_lengths():
+    rng = random.Random(11)
+    for _ in range(50):
+        start = rng.randint(-10, 10**7)
+        end = start + rng.randint(-10, 10**7)
+        assert count_passwords(start, end) == \
+            find_enumerated(start, end, has_double), (start, end)
+        assert count_passwords(start, end, exact=True) == \
+            find_enumerated(start, end, has_exact_double), (start, end)
+
+
+def test_huge_ranges():
+    # every ten-digit number with non-decreasing digits repeats a digit
+    assert count_passwords(10**9, 10**10 - 1) == 43758
+    assert count_passwords(1, 10**40) > count_passwords(1, 10**20, True)
+    assert count_passwords(10**18, 10**18) == 0
+    assert count_passwords(111111111111111111, 111111111111111111) == 1
+    assert count_passwords(
+        111111111111111111, 111111111111111111, exact=True) == 0
@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from password_batch import (  # noqa: E402
+    chunks, count_batch, digit_matrix, find_batch, find_brute_force,
+    has_run, meets_exact_criteria_batch,
+)
+from rules import PART1, PART2, Automaton, HasRun  # noqa: E402
+
+
+def test_puzzle_range():
+    assert find_brute_force(372304, 847060) == 475
+    assert find_brute_force(372304, 847060, meets_exact_criteria_batch) == 297
+
+
+def test_digit_matrix():
+    digits = digit_matrix(np.array([123456, 900001]), 6)
+    assert digits.tolist() == [[1, 2, 3, 4, 5, 6], [9, 0, 0, 0, 0, 1]]
+
+
+def test_chunks_split_on_length_and_size():
+    arrays = list(chunks(-3, 1234, chunk_size=500))
+    assert np.concatenate(arrays).tolist() == list(range(0, 1235))
+    for values in arrays:
+        assert len(values) <= 500
+        assert len({len(str(v)) for v in values.tolist()}) == 1
+
+
+def test_matches_automaton():
+    rng = random.Random(14)
+    part1 = Automaton(PART1)
+    part2 = Automaton(PART2)
+    for _ in range(20):
+        start = rng.randint(-10, 10**6)
+        end = start + rng.randint(-10, 50000)
+        chunk_size = rng.choice([997, 1 << 18])
+        assert find_batch(start, end, chunk_size=chunk_size).tolist() == \
+            list(part1.matching(start, end))
+        assert find_batch(start, end, meets_exact_criteria_batch,
+                          chunk_size).tolist() == \
+            list(part2.matching(start, end))
+
+
+def test_custom_criteria():
+    automaton = Automaton([HasRun(3, 4)])
+    start, end = 10**6, 2 * 10**6
+    assert count_batch(
+        start, end, lambda digits: has_run(digits, 3, 4)) == \
+        automaton.count(start, end)
@@ -0,0 +1,66 @@
+import random
+
+from digit_dp import count_passwords
+from rules import (
+    PART1, PART2, Automaton, ForbiddenDigits, HasRun, NonDecreasing,
+)
+
+
+def _passes(rules, n):
+    states = [rule.start for rule in rules]
+    for digit in map(int, str(n)):
+        for i, rule in enumerate(rules):
+            if states[i] is not None:
+                states[i] = rule.step(states[i], digit)
+    return all(state is not None and rule.accepts(state)
+               for rule, state in zip(rules, states))
+
+
+RULE_SETS = [
+    PART1,
+    PART2,
+    (NonDecreasing(), HasRun(3)),
+    (HasRun(2, 2), ForbiddenDigits([0, 5])),
+    (NonDecreasing(), HasRun(2, 3), ForbiddenDigits([9])),
+    (ForbiddenDigits([1, 3, 5, 7]),),
+]
+
+
+def test_matches_rule_by_rule_scan():
+    rng = random.Random(12)
+    for rules in RULE_SETS:
+        automaton = Automaton(rules)
+        for _ in range(2000):
+            n = rng.randint(0, 10**rng.randint(1, 9))
+            assert automaton.matches(n) == _passes(rules, n), (rules, n)
+
+
+def test_count_and_matching_agree_with_scan():
+    rng = random.Random(13)
+    for rules in RULE_SETS:
+        automaton = Automaton(rules)
+        for _ in range(20):
+            start = rng.randint(-10, 30000)
+            end = start + rng.randint(-10, 3000)
+            expected = [n for n in range(max(start, 0), end + 1)
+                        if _passes(rules, n)]
+            assert list(automaton.matching(start, end)) == expected, \
+                (rules, start, end)
+            assert automaton.count(start, end) == len(expected), \
+                (rules, start, end)
+
+
+def test_count_matches_digit_dp():
+    part1 = Automaton(PART1)
+    part2 = Automaton(PART2)
+    assert part1.count(372304, 847060) == 475
+    assert part2.count(372304, 847060) == 297
+    for start, end in [(1, 10**18), (12345678901234, 98765432109876543210)]:
+        assert part1.count(start, end) == count_passwords(start, end)
+        assert part2.count(start, end) == count_passwords(start, end, True)
+
+
+def test_matching_prunes_dead_prefixes():
+    automaton = Automaton(PART2)
+    assert next(automaton.matching(10**29, 10**30)) == \
+        int("1" * 28 + "22")
@@ -0,0 +1,43 @@
+import pytest
+
+from rules import PART1, PART2, Automaton, ForbiddenDigits, HasRun
+from scan import scan_range, split_range
+
+
+def test_split_range():
+    assert split_range(5, 17, 5) == [(5, 9), (10, 14), (15, 17)]
+    assert split_range(5, 5, 5) == [(5, 5)]
+    assert split_range(6, 5, 5) == []
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_scan_matches_automaton(workers):
+    automaton = Automaton(PART2)
+    seen = []
+    result = scan_range(
+        111000, 140000, automaton.matches, workers=workers, chunk_size=997,
+        collect=True, progress=lambda *args: seen.append(args))
+    expected = list(automaton.matching(111000, 140000))
+    assert result.matches == expected
+    assert result.count == len(expected)
+    assert result.numbers == 29001
+    assert sorted(done for done, _, _ in seen) == [done for done, _, _ in seen]
+    assert seen[-1][:2] == (29001, 29001)
+
+
+def test_scan_without_matches():
+    automaton = Automaton([HasRun(3), ForbiddenDigits([0])])
+    result = scan_range(0, 50000, automaton.matches, workers=2,
+                        chunk_size=4096)
+    assert result.matches is None
+    assert result.count == automaton.count(0, 50000)
+
+
+def test_scan_batch_validator():
+    pytest.importorskip("numpy")
+    import password_batch
+
+    result = scan_range(
+        372304, 847060, password_batch.meets_criteria_batch, batch=True,
+        workers=2, chunk_size=1 << 16)
+    assert result.count == Automaton(PART1).count(372304, 847060) == 475
@@ -0,0 +1,57 @@
+"""
+Measures interpreter throughput on the diagnostic program with and without
+the opcode decode cache.
+
+Usage: python bench_decode.py [repeat]
+"""
+import sys
+import time
+from typing import List, Optional
+
+import part2
+from channels import input_reader
+
+
+SYSTEM_ID = 5
+
+
+def count_instructions(program: List[int]) -> int:
+    sequence = list(program)
+    read = input_reader([SYSTEM_ID])
+    outputs: List[int] = []
+    count = 0
+    idx: Optional[int] = 0
+    while idx is not None and idx < len(sequence):
+        idx = part2.single_process(sequence, idx, read, outputs.append)
+        count += 1
+    return count
+
+
+def time_runs(program: List[int], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        part2.run_program(list(program), [SYSTEM_ID], [])
+    return time.perf_counter() - start
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with open("input") as fin:
+        program = [int(x) for x in fin.readline().strip().split(',')]
+
+    cached = part2.decode_opcode
+    instructions = count_instructions(program) * repeat
+
+    part2.decode_opcode = cached.__wrapped__
+    before = time_runs(program, repeat)
+    part2.decode_opcode = cached
+    after = time_runs(program, repeat)
+
+    print(f"instructions: {instructions}")
+    print(f"uncached: {instructions / before:,.0f} instructions/s")
+    print(f"cached:   {instructions / after:,.0f} instructions/s "
+          f"({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
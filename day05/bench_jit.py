@@ -0,0 +1,36 @@
+"""
+Compares the interpreter and the compiler backend on a long-running loop.
+
+Usage: python bench_jit.py [iterations]
+"""
+import sys
+import time
+
+import jit
+import part2
+
+
+# Reads n, sums 1..n in a loop and outputs the result.
+LOOP_PROGRAM = [
+    3, 23, 1101, 0, 0, 24, 1006, 23, 20, 1, 24, 23, 24, 1001, 23, -1, 23,
+    1105, 1, 6, 4, 24, 99, 0, 0,
+]
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+
+    start = time.perf_counter()
+    part2.run_program(list(LOOP_PROGRAM), [iterations], [])
+    interpreted = time.perf_counter() - start
+
+    start = time.perf_counter()
+    jit.run_program(list(LOOP_PROGRAM), [iterations], [])
+    compiled = time.perf_counter() - start
+
+    print(f"interpreter: {interpreted:.3f}s")
+    print(f"compiled:    {compiled:.3f}s ({interpreted / compiled:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
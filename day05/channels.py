@@ -0,0 +1,55 @@
+"""
+Input and output channels for the Intcode machines.
+
+An input channel is read through a function that returns the next value or
+None when no value is available yet. The machine then stops at the input
+instruction instead of blocking, and can be resumed once the channel has
+been refilled. Supported input channels are `collections.deque` buffers
+(consumed from the left), callables and any other iterable. Output channels
+are callables or anything with an `append` method.
+"""
+from collections import deque
+from typing import Any, Callable, Optional
+
+
+Reader = Callable[[], Optional[int]]
+Writer = Callable[[int], None]
+
+
+class InputUnavailable(Exception):
+    """
+    Raised by an input instruction whose channel is empty. The only
+    argument is the address of the instruction.
+    """
+
+
+def console_reader() -> int:
+    return int(input("Enter: "))
+
+
+def input_reader(channel: Any = None) -> Reader:
+    if channel is None:
+        return console_reader
+    if isinstance(channel, deque):
+        return lambda: channel.popleft() if channel else None
+    if callable(channel):
+        return channel
+    iterator = iter(channel)
+    return lambda: next(iterator, None)
+
+
+def output_writer(channel: Any = None) -> Writer:
+    if channel is None:
+        return print
+    if callable(channel):
+        return channel
+    return channel.append
+
+
+_buffer: deque = deque([1, 2])
+_read = input_reader(_buffer)
+assert (_read(), _read(), _read()) == (1, 2, None)
+_buffer.append(3)
+assert _read() == 3
+_read = input_reader(iter([4]))
+assert (_read(), _read()) == (4, None)
@@ -0,0 +1,73 @@
+"""
+Batch runner for the diagnostic program over many input vectors.
+
+The program is parsed once and handed to each worker process a single time
+through the pool initializer. Every run then starts from a fresh copy of
+that read-only image, so runs never see each other's writes. Results are
+streamed back in input order.
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from part2 import run_program
+
+
+DEFAULT_CHUNKSIZE = 256
+
+_program: Tuple[int, ...] = ()
+
+
+def _load_program(program: Tuple[int, ...]) -> None:
+    global _program
+    _program = program
+
+
+def run_diagnostic(inputs: Sequence[int]) -> List[int]:
+    """
+    Runs the program loaded in this process on one input vector and
+    returns its outputs.
+    """
+    outputs: List[int] = []
+    run_program(list(_program), inputs, outputs)
+    return outputs
+
+
+def run_diagnostics(
+        program: Sequence[int],
+        input_vectors: Iterable[Sequence[int]],
+        workers: Optional[int] = None,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        ) -> Iterator[List[int]]:
+    """
+    Yields the outputs of one run per input vector, in order, using a pool
+    of `workers` processes (all cores by default).
+    """
+    with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_load_program,
+            initargs=(tuple(program),),
+            ) as executor:
+        yield from executor.map(
+            run_diagnostic, input_vectors, chunksize=chunksize)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("system_ids", type=int, nargs="+")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    with open("input") as fin:
+        line = fin.readline()
+
+    sequence = [int(x) for x in line.strip().split(',')]
+
+    input_vectors = ([system_id] for system_id in args.system_ids)
+    results = run_diagnostics(sequence, input_vectors, args.workers)
+    for system_id, outputs in zip(args.system_ids, results):
+        print(system_id, outputs[-1] if outputs else None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Resumable Intcode virtual machine.
+
+`IntcodeVM` keeps the instruction pointer, the pending inputs and the
+produced outputs alongside the memory, so a machine can be paused at any
+instruction, resumed later, snapshotted and restored. Instructions are
+executed by `part2.single_process`.
+
+Memory is a `memory.PagedMemory`. Taking a snapshot only copies its page
+table; a page is copied the first time either side writes to it, so many
+branches forked from a shared prefix share all unmodified pages. Because
+of it, two things differ from the day 5 interpreter, which runs on a
+plain list: addresses past the loaded program read as 0 and can be
+written, instead of raising `IndexError`, and negative addresses raise
+`IndexError` instead of wrapping around the end of memory. Programs that
+stay inside their own memory behave the same on both.
+"""
+from collections import deque
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from channels import InputUnavailable
+from memory import PagedMemory
+from part2 import single_process
+
+
+class Snapshot(NamedTuple):
+    memory: PagedMemory
+    ip: Optional[int]
+    inputs: Tuple[int, ...]
+    outputs: Tuple[int, ...]
+    steps: int
+
+
+class IntcodeVM:
+    def __init__(self, program: Iterable[int], inputs: Iterable[int] = ()):
+        self.memory = PagedMemory(program)
+        self.ip: Optional[int] = 0
+        self.inputs: deque = deque(inputs)
+        self.outputs: List[int] = []
+        self.steps = 0
+
+    @property
+    def halted(self) -> bool:
+        return self.ip is None or self.ip >= len(self.memory)
+
+    def _read(self) -> Optional[int]:
+        return self.inputs.popleft() if self.inputs else None
+
+    def send(self, *values: int) -> None:
+        self.inputs.extend(values)
+
+    def step(self) -> Optional[int]:
+        """
+        Executes a single instruction and returns the new instruction
+        pointer, or None once the program has halted. Raises
+        `InputUnavailable` without moving the instruction pointer when the
+        instruction needs input and none is pending.
+        """
+        if self.halted:
+            return None
+        self.ip = single_process(
+            self.memory, self.ip, self._read, self.outputs.append)
+        self.steps += 1
+        return None if self.halted else self.ip
+
+    def run_until_input(self) -> bool:
+        """
+        Runs until the program needs input that has not been sent yet.
+        Returns False if the program halted instead.
+        """
+        try:
+            while self.step() is not None:
+                pass
+        except InputUnavailable:
+            return True
+        return False
+
+    def run_until_output(self) -> Optional[int]:
+        """
+        Runs until the program produces its next output and returns it.
+        Returns None if the program halted or is waiting for input first.
+        """
+        produced = len(self.outputs)
+        try:
+            while len(self.outputs) == produced:
+                if self.step() is None:
+                    return None
+        except InputUnavailable:
+            return None
+        return self.outputs[-1]
+
+    def snapshot(self) -> Snapshot:
+        return Snapshot(
+            self.memory.copy(), self.ip, tuple(self.inputs),
+            tuple(self.outputs), self.steps)
+
+    def restore(self, snapshot: Snapshot) -> None:
+        self.memory = snapshot.memory.copy()
+        self.ip = snapshot.ip
+        self.inputs = deque(snapshot.inputs)
+        self.outputs = list(snapshot.outputs)
+        self.steps = snapshot.steps
+
+    def fork(self) -> "IntcodeVM":
+        """
+        Returns an independent machine in the same state as this one.
+        """
+        clone = IntcodeVM.__new__(IntcodeVM)
+        clone.restore(self.snapshot())
+        return clone
+
+
+if __name__ == "__main__":
+
+    with open("input") as fin:
+        line = fin.readline()
+
+    prefix = IntcodeVM(int(x) for x in line.strip().split(','))
+    prefix.run_until_input()
+    for system_id in [1, 5]:
+        vm = prefix.fork()
+        vm.send(system_id)
+        vm.run_until_input()
+        print(system_id, vm.outputs[-1])
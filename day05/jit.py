@@ -0,0 +1,296 @@
+"""
+Intcode-to-Python compiler backend.
+
+Runs of instructions are translated into Python functions, one per entry
+address, and executed through a small dispatch loop. A translated trace
+follows fall-through edges and jumps whose target is known when the code is
+compiled, and becomes a `while True` loop when it reaches its own entry
+address again, so a tight Intcode loop runs as a single Python call.
+
+Operands are baked into the generated source, so a write into any address
+covered by a compiled trace discards that trace and returns to the dispatch
+loop. Entry addresses that keep getting rewritten are handed to the
+interpreter in `part2` instead of being compiled again.
+"""
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from channels import InputUnavailable, input_reader, output_writer
+from part2 import decode_opcode, single_process
+
+
+MAX_TRACE_LENGTH = 256
+MAX_INVALIDATIONS = 4
+INSTRUCTION_SIZES = {1: 4, 2: 4, 3: 2, 4: 2, 5: 3, 6: 3, 7: 4, 8: 4, 99: 1}
+BINARY_EXPRESSIONS = {
+    1: "{} + {}",
+    2: "{} * {}",
+    7: "1 if {} < {} else 0",
+    8: "1 if {} == {} else 0",
+}
+
+Block = Callable[[List[int]], Optional[int]]
+
+
+def decode_instruction(
+        seq: List[int], idx: int
+        ) -> Optional[Tuple[int, Tuple[int, int, int], int]]:
+    """
+    Returns the opcode, parameter modes and size of the instruction at
+    `idx`, or None when the interpreter would raise on it.
+    """
+    if not 0 <= idx < len(seq):
+        return None
+    try:
+        opcode, *modes = decode_opcode(seq[idx])
+    except ValueError:
+        return None
+    size = INSTRUCTION_SIZES[opcode]
+    if idx + size > len(seq):
+        return None
+    if any(mode not in (0, 1) for mode in modes[:size - 1]):
+        return None
+    return opcode, (modes[0], modes[1], modes[2]), size
+
+
+def wrap_address(seq: List[int], address: int) -> int:
+    """
+    Maps a negative address to the cell Python indexing writes to, so it
+    can be matched against the addresses covered by traces.
+    """
+    if -len(seq) <= address < 0:
+        return address + len(seq)
+    return address
+
+
+def write_address(seq: List[int], idx: int) -> Optional[int]:
+    """
+    Returns the cell the instruction at `idx` is about to write, if any.
+    Indexing follows `part2.single_process`, so negative instruction
+    pointers and addresses wrap around the end of memory.
+    """
+    try:
+        opcode, *modes = decode_opcode(seq[idx])
+    except (IndexError, ValueError):
+        return None
+    if opcode not in (1, 2, 3, 7, 8):
+        return None
+    size = INSTRUCTION_SIZES[opcode]
+    param = idx + size - 1
+    if not -len(seq) <= param < len(seq):
+        return None
+    address = seq[param] if modes[size - 2] == 0 else param
+    if not -len(seq) <= address < len(seq):
+        return None
+    return wrap_address(seq, address)
+
+
+class CompiledProgram:
+    def __init__(self, sequence: List[int], inputs=None, outputs=None):
+        self.memory = sequence
+        self.read = input_reader(inputs)
+        self.write = output_writer(outputs)
+        self.blocks: Dict[int, Block] = dict()
+        self.covered: Dict[int, Set[int]] = dict()
+        self.block_addresses: Dict[int, Set[int]] = dict()
+        self.invalidations: Dict[int, int] = dict()
+        self.interpreted: Set[int] = set()
+        self.compile_reachable(0)
+
+    def translate(
+            self, start: int
+            ) -> Optional[Tuple[str, Set[int], Set[int]]]:
+        """
+        Translates the trace starting at `start` into the source of a Python
+        function. Returns the source, the addresses the trace reads its
+        instructions from, and the statically known exit addresses.
+        """
+        seq = self.memory
+
+        def _operand(idx, mode):
+            return f"mem[{seq[idx]}]" if mode == 0 else str(seq[idx])
+
+        def _goto(target):
+            if target == start:
+                return "continue"
+            exits.add(target)
+            return f"return {target}"
+
+        lines: List[str] = []
+        addresses: Set[int] = set()
+        exits: Set[int] = set()
+        trace: Set[int] = set()
+        idx = start
+        while True:
+            decoded = decode_instruction(seq, idx)
+            if decoded is None or len(trace) >= MAX_TRACE_LENGTH:
+                lines.append(_goto(idx))
+                break
+            if not trace and idx in self.interpreted:
+                return None
+            opcode, modes, size = decoded
+            trace.add(idx)
+            addresses.update(range(idx, idx + size))
+            next_idx = idx + size
+
+            if opcode in BINARY_EXPRESSIONS:
+                value = BINARY_EXPRESSIONS[opcode].format(
+                    _operand(idx + 1, modes[0]), _operand(idx + 2, modes[1]))
+                target = seq[idx + 3] if modes[2] == 0 else idx + 3
+            elif opcode == 3:
+                lines.append("value = read()")
+                lines.append("if value is None:")
+                lines.append(f"    raise InputUnavailable({idx})")
+                value = "value"
+                target = seq[idx + 1] if modes[0] == 0 else idx + 1
+            elif opcode == 4:
+                lines.append(f"write({_operand(idx + 1, modes[0])})")
+            elif opcode in (5, 6):
+                if modes[1] == 1:
+                    jump_target: Optional[int] = seq[idx + 2]
+                else:
+                    jump_target = None
+                if modes[0] == 1:
+                    taken = (seq[idx + 1] != 0) == (opcode == 5)
+                    if taken and jump_target is None:
+                        lines.append(f"return {_operand(idx + 2, 0)}")
+                        break
+                    if taken:
+                        next_idx = jump_target
+                else:
+                    comparison = "!=" if opcode == 5 else "=="
+                    lines.append(
+                        f"if {_operand(idx + 1, modes[0])} {comparison} 0:")
+                    if jump_target is None:
+                        lines.append(f"    return {_operand(idx + 2, 0)}")
+                    else:
+                        lines.append(f"    {_goto(jump_target)}")
+            elif opcode == 99:
+                lines.append("return None")
+                break
+
+            if opcode in BINARY_EXPRESSIONS or opcode == 3:
+                target = wrap_address(seq, target)
+                lines.append(f"mem[{target}] = {value}")
+                lines.append(f"if {target} in covered:")
+                lines.append(f"    return invalidate({target}, {next_idx})")
+
+            idx = next_idx
+            if idx == start or idx in trace:
+                lines.append(_goto(idx))
+                break
+
+        if not trace:
+            return None
+        body = "\n".join(f"        {line}" for line in lines)
+        source = f"def block_{start}(mem):\n    while True:\n{body}\n"
+        return source, addresses, exits
+
+    def compile(self, start: int) -> Optional[Block]:
+        translated = self.translate(start)
+        if translated is None:
+            return None
+        return self.install(start, translated)
+
+    def install(
+            self, start: int, translated: Tuple[str, Set[int], Set[int]]
+            ) -> Block:
+        source, addresses, _ = translated
+        namespace = {
+            "covered": self.covered,
+            "invalidate": self.invalidate,
+            "read": self.read,
+            "write": self.write,
+            "InputUnavailable": InputUnavailable,
+        }
+        exec(compile(source, f"<intcode block {start}>", "exec"), namespace)
+        block = namespace[f"block_{start}"]
+        self.blocks[start] = block
+        self.block_addresses[start] = addresses
+        for address in addresses:
+            self.covered.setdefault(address, set()).add(start)
+        return block
+
+    def compile_reachable(self, start: int) -> None:
+        """
+        Compiles every trace reachable from `start` through statically
+        known exits.
+        """
+        pending = [start]
+        while pending:
+            address = pending.pop()
+            if address in self.blocks:
+                continue
+            translated = self.translate(address)
+            if translated is None:
+                continue
+            self.install(address, translated)
+            pending.extend(translated[2] - set(self.blocks))
+
+    def discard(self, start: int) -> None:
+        del self.blocks[start]
+        for address in self.block_addresses.pop(start):
+            starts = self.covered.get(address)
+            if starts is None:
+                continue
+            starts.discard(start)
+            if not starts:
+                del self.covered[address]
+        self.invalidations[start] = self.invalidations.get(start, 0) + 1
+        if self.invalidations[start] >= MAX_INVALIDATIONS:
+            self.interpreted.add(start)
+
+    def invalidate(self, address: int, next_idx: int) -> int:
+        """
+        Discards every compiled trace that reads an instruction from
+        `address` and returns the address to resume execution at.
+        """
+        for start in list(self.covered.get(address, ())):
+            self.discard(start)
+        return next_idx
+
+    def interpret(self, idx: int) -> Optional[int]:
+        address = write_address(self.memory, idx)
+        next_idx = single_process(self.memory, idx, self.read, self.write)
+        if address is not None and address in self.covered:
+            self.invalidate(address, idx)
+        return next_idx
+
+    def execute(self) -> Iterator[int]:
+        """
+        Runs the program as a generator, yielding the address of the input
+        instruction whenever the input channel is empty.
+        """
+        mem = self.memory
+        blocks = self.blocks
+        interpreted = self.interpreted
+        idx: Optional[int] = 0
+        while idx is not None and idx < len(mem):
+            block = blocks.get(idx)
+            if block is None and idx not in interpreted:
+                block = self.compile(idx)
+            try:
+                if block is None:
+                    idx = self.interpret(idx)
+                else:
+                    idx = block(mem)
+            except InputUnavailable as e:
+                idx = e.args[0]
+                yield idx
+
+    def run(self) -> None:
+        for idx in self.execute():
+            raise InputUnavailable(idx)
+
+
+def run_program(sequence: List[int], inputs=None, outputs=None) -> None:
+    CompiledProgram(sequence, inputs, outputs).run()
+
+
+if __name__ == "__main__":
+
+    with open("input") as fin:
+        line = fin.readline()
+
+    sequence = [int(x) for x in line.strip().split(',')]
+
+    run_program(sequence)
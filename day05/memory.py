@@ -0,0 +1,99 @@
+"""
+Compact, copy-on-write memory for the Intcode machines.
+
+The program image is split into fixed-size pages stored as `array('q')`,
+eight bytes per cell instead of a pointer to a boxed `int`. A page that
+receives a value which does not fit in 64 bits is promoted to a plain list,
+so arbitrary-precision arithmetic keeps working on that page only.
+
+Addresses past the end of the loaded image live in a sparse dict, where
+unwritten cells read as 0. The length of the memory stays the length of
+the loaded image, so the interpreter loops still stop at the same point.
+
+Copying the memory only copies the page table; a page is copied the first
+time either side writes to it.
+"""
+from array import array
+from typing import Dict, Iterable, List, Sequence, Union
+
+
+PAGE_BITS = 8
+PAGE_SIZE = 1 << PAGE_BITS
+PAGE_MASK = PAGE_SIZE - 1
+
+Page = Union[array, List[int]]
+
+
+def make_page(values: Sequence[int]) -> Page:
+    try:
+        return array('q', values)
+    except OverflowError:
+        return list(values)
+
+
+class PagedMemory:
+    def __init__(self, values: Iterable[int] = ()):
+        values = list(values)
+        self.length = len(values)
+        self.pages: List[Page] = [
+            make_page(values[start:start + PAGE_SIZE])
+            for start in range(0, len(values), PAGE_SIZE)
+        ]
+        self.owned = [True] * len(self.pages)
+        self.overflow: Dict[int, int] = dict()
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, address: int) -> int:
+        if 0 <= address < self.length:
+            return self.pages[address >> PAGE_BITS][address & PAGE_MASK]
+        if address < 0:
+            raise IndexError(address)
+        return self.overflow.get(address, 0)
+
+    def __setitem__(self, address: int, value: int) -> None:
+        if not 0 <= address < self.length:
+            if address < 0:
+                raise IndexError(address)
+            self.overflow[address] = value
+            return
+        page = address >> PAGE_BITS
+        if not self.owned[page]:
+            self.pages[page] = self.pages[page][:]
+            self.owned[page] = True
+        try:
+            self.pages[page][address & PAGE_MASK] = value
+        except OverflowError:
+            self.pages[page] = list(self.pages[page])
+            self.pages[page][address & PAGE_MASK] = value
+
+    def copy(self) -> "PagedMemory":
+        """
+        Returns a copy that shares every page with this memory. Shared
+        pages are copied on the next write from either side.
+        """
+        clone = PagedMemory.__new__(PagedMemory)
+        clone.length = self.length
+        clone.pages = self.pages[:]
+        clone.owned = [False] * len(self.pages)
+        clone.overflow = dict(self.overflow)
+        self.owned = [False] * len(self.pages)
+        return clone
+
+    def tolist(self) -> List[int]:
+        """
+        Returns the loaded image; the sparse region is not included.
+        """
+        return [value for page in self.pages for value in page]
+
+
+_memory = PagedMemory(range(PAGE_SIZE + 1))
+_clone = _memory.copy()
+_clone[PAGE_SIZE] = -1
+assert _memory[PAGE_SIZE] == PAGE_SIZE and _clone[PAGE_SIZE] == -1
+assert _memory.pages[0] is _clone.pages[0]
+_clone[10**6] = 2**70
+assert _clone[10**6] == 2**70 and _memory[10**6] == 0
+_clone[0] = 2**70
+assert _clone[0] == 2**70 and _memory[0] == 0
@@ -72,10 +72,21 @@ diagnostic code.
 
 What is the diagnostic code for system ID 5?
 """
-from typing import Tuple, List, Optional
+from functools import lru_cache
+from typing import Iterator, Tuple, List, Optional
 
+from channels import (
+    InputUnavailable, Reader, Writer, console_reader, input_reader,
+    output_writer)
 
+
+@lru_cache(maxsize=None)
 def decode_opcode(value: int) -> Tuple[int, int, int, int]:
+    """
+    Splits an instruction word into its opcode and parameter modes. Results
+    are cached on the raw word, so the string decoding runs once per
+    distinct instruction word instead of once per executed instruction.
+    """
     padded = str(value).zfill(5)
     op = int(padded[-2:])
     if op in [1, 2, 7, 8]:
@@ -116,7 +127,12 @@ def put_mode_value(seq: List[int], idx: int, mode: int, value: int):
         raise ValueError("Invalid mode: %d", mode)
 
 
-def single_process(seq: List[int], idx: int) -> Optional[int]:
+def single_process(
+        seq: List[int],
+        idx: int,
+        read: Reader = console_reader,
+        write: Writer = print,
+        ) -> Optional[int]:
     opcode, *modes = decode_opcode(seq[idx])
     if opcode == 1:
         value1 = get_mode_value(seq, idx + 1, modes[0])
@@ -129,12 +145,14 @@ def single_process(seq: List[int], idx: int) -> Optional[int]:
         put_mode_value(seq, idx + 3, modes[2], value1 * value2)
         return idx + 4
     elif opcode == 3:
-        input_value = int(input("Enter: "))
+        input_value = read()
+        if input_value is None:
+            raise InputUnavailable(idx)
         put_mode_value(seq, idx + 1, modes[0], input_value)
         return idx + 2
     elif opcode == 4:
         output_value = get_mode_value(seq, idx + 1, modes[0])
-        print(output_value)
+        write(output_value)
         return idx + 2
     elif opcode == 5:
         value1 = get_mode_value(seq, idx + 1, modes[0])
@@ -166,15 +184,34 @@ def single_process(seq: List[int], idx: int) -> Optional[int]:
         raise ValueError("Invalid op: %d", opcode)
 
 
-def run_program(sequence: List[int]) -> None:
+def execute(
+        sequence: List[int], inputs=None, outputs=None
+        ) -> Iterator[int]:
+    """
+    Runs a program as a generator over the given input and output channels.
+    Whenever the program needs input that is not available yet, the
+    generator yields the address of the input instruction; resuming it
+    retries the read.
+    """
+    read = input_reader(inputs)
+    write = output_writer(outputs)
     curr_idx = 0
     while curr_idx < len(sequence):
-        next_idx = single_process(sequence, curr_idx)
+        try:
+            next_idx = single_process(sequence, curr_idx, read, write)
+        except InputUnavailable:
+            yield curr_idx
+            continue
         if next_idx is None:
             break
         curr_idx = next_idx
 
 
+def run_program(sequence: List[int], inputs=None, outputs=None) -> None:
+    for curr_idx in execute(sequence, inputs, outputs):
+        raise InputUnavailable(curr_idx)
+
+
 if __name__ == "__main__":
 
     with open("input") as fin:
@@ -0,0 +1,178 @@
+"""
+Instruction-level profiler for the day 5 Intcode interpreter.
+
+`execute_profiled` is a copy of the `part2.execute` loop that records, for
+every executed instruction, the opcode, the instruction address, the
+outcome of jumps and the addresses read and written by the instruction.
+Execution itself still goes through `part2.single_process`. The plain
+interpreter loop is left untouched, so running without the profiler costs
+nothing.
+
+A profile can be exported as JSON or as folded stacks
+(`opcode;address count` lines) for flamegraph tools.
+"""
+import argparse
+import json
+import time
+from collections import Counter
+from typing import Dict, Iterator, List
+
+from channels import InputUnavailable, input_reader, output_writer
+from part2 import decode_opcode, get_mode_value, single_process
+
+
+OPCODE_NAMES = {
+    1: "add", 2: "mul", 3: "in", 4: "out", 5: "jnz", 6: "jz", 7: "lt",
+    8: "eq", 99: "halt",
+}
+# Parameters each opcode reads from memory before executing, and the
+# parameter holding the address it writes to.
+READ_PARAMS = {1: (1, 2), 2: (1, 2), 4: (1,), 5: (1,), 6: (1,),
+               7: (1, 2), 8: (1, 2)}
+WRITE_PARAM = {1: 3, 2: 3, 3: 1, 7: 3, 8: 3}
+
+
+class Profile:
+    def __init__(self):
+        self.opcodes: Counter = Counter()
+        self.addresses: Counter = Counter()
+        self.stacks: Counter = Counter()
+        self.branches_taken: Counter = Counter()
+        self.branches: Counter = Counter()
+        self.reads: Counter = Counter()
+        self.writes: Counter = Counter()
+        self.seconds = 0.0
+
+    @property
+    def instructions(self) -> int:
+        return sum(self.opcodes.values())
+
+    def branch_ratios(self) -> Dict[int, float]:
+        """
+        Returns the fraction of executions in which the jump at each address
+        was taken.
+        """
+        return {
+            address: self.branches_taken[address] / count
+            for address, count in self.branches.items()
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "instructions": self.instructions,
+            "seconds": self.seconds,
+            "opcodes": {
+                OPCODE_NAMES.get(op, str(op)): count
+                for op, count in self.opcodes.most_common()
+            },
+            "addresses": dict(sorted(self.addresses.items())),
+            "branch_ratios": dict(sorted(self.branch_ratios().items())),
+            "reads": dict(sorted(self.reads.items())),
+            "writes": dict(sorted(self.writes.items())),
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def folded_stacks(self) -> str:
+        """
+        Returns one `opcode;address count` line per opcode executed at each
+        address.
+        """
+        lines = []
+        for (address, op), count in sorted(self.stacks.items()):
+            lines.append(f"{OPCODE_NAMES.get(op, op)};{address} {count}")
+        return "\n".join(lines) + "\n"
+
+
+def execute_profiled(
+        sequence: List[int], profile: Profile, inputs=None, outputs=None
+        ) -> Iterator[int]:
+    """
+    Same as `part2.execute`, recording every executed instruction in
+    `profile`.
+    """
+    read = input_reader(inputs)
+    write = output_writer(outputs)
+    start = time.perf_counter()
+    curr_idx = 0
+    while curr_idx < len(sequence):
+        opcode, *modes = decode_opcode(sequence[curr_idx])
+        read_addresses = [
+            sequence[curr_idx + param]
+            for param in READ_PARAMS.get(opcode, ())
+            if modes[param - 1] == 0
+        ]
+        write_param = WRITE_PARAM.get(opcode)
+        if write_param is None:
+            write_address = None
+        elif modes[write_param - 1] == 0:
+            write_address = sequence[curr_idx + write_param]
+        else:
+            write_address = curr_idx + write_param
+        if opcode in (5, 6):
+            condition = get_mode_value(sequence, curr_idx + 1, modes[0])
+            taken = (condition != 0) == (opcode == 5)
+        try:
+            next_idx = single_process(sequence, curr_idx, read, write)
+        except InputUnavailable:
+            profile.seconds += time.perf_counter() - start
+            yield curr_idx
+            start = time.perf_counter()
+            continue
+
+        profile.opcodes[opcode] += 1
+        profile.addresses[curr_idx] += 1
+        profile.stacks[curr_idx, opcode] += 1
+        profile.reads.update(read_addresses)
+        if write_address is not None:
+            profile.writes[write_address] += 1
+        if opcode in (5, 6):
+            profile.branches[curr_idx] += 1
+            if taken:
+                profile.branches_taken[curr_idx] += 1
+                if modes[1] == 0:
+                    profile.reads[sequence[curr_idx + 2]] += 1
+
+        if next_idx is None:
+            break
+        curr_idx = next_idx
+    profile.seconds += time.perf_counter() - start
+
+
+def run_program_profiled(
+        sequence: List[int], inputs=None, outputs=None
+        ) -> Profile:
+    profile = Profile()
+    for curr_idx in execute_profiled(sequence, profile, inputs, outputs):
+        raise InputUnavailable(curr_idx)
+    return profile
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("inputs", type=int, nargs="*")
+    parser.add_argument("--json", dest="json_file")
+    parser.add_argument("--folded", dest="folded_file")
+    args = parser.parse_args()
+
+    with open("input") as fin:
+        line = fin.readline()
+
+    sequence = [int(x) for x in line.strip().split(',')]
+
+    outputs: List[int] = []
+    profile = run_program_profiled(sequence, args.inputs, outputs)
+    print(outputs)
+    if args.json_file:
+        with open(args.json_file, "w") as fout:
+            fout.write(profile.to_json())
+    else:
+        print(profile.to_json())
+    if args.folded_file:
+        with open(args.folded_file, "w") as fout:
+            fout.write(profile.folded_stacks())
+
+
+if __name__ == "__main__":
+    main()
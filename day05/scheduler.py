@@ -0,0 +1,156 @@
+"""
+asyncio scheduler for networks and fleets of Intcode machines.
+
+Every machine runs as a coroutine around an `IntcodeVM`. Inputs arrive
+through an `asyncio.Queue` per machine, and outputs are forwarded to the
+queues of the machines it is connected to. One machine may feed several
+others (fan-out) and several machines may feed the same one (fan-in).
+Machines execute in slices of instructions and yield to the event loop
+between slices, so a busy machine cannot starve the others.
+
+The network stops when every machine has halted, or when every machine
+still running waits for input that nobody is going to send.
+"""
+import asyncio
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from channels import InputUnavailable
+from intcode import IntcodeVM
+
+
+SLICE_STEPS = 1000
+
+
+class MachineStats:
+    def __init__(self, name: str):
+        self.name = name
+        self.steps = 0
+        self.input_wait = 0.0
+        self.halted = False
+
+    def __repr__(self) -> str:
+        return (f"MachineStats({self.name!r}, steps={self.steps}, "
+                f"input_wait={self.input_wait:.6f}, halted={self.halted})")
+
+
+class Network:
+    def __init__(self, slice_steps: int = SLICE_STEPS):
+        self.slice_steps = slice_steps
+        self.vms: Dict[str, IntcodeVM] = dict()
+        self.targets: Dict[str, List[str]] = dict()
+        self.stats: Dict[str, MachineStats] = dict()
+
+    def add_machine(
+            self, name: str, program: Sequence[int], inputs: Iterable[int] = ()
+            ) -> IntcodeVM:
+        if name in self.vms:
+            raise ValueError("Duplicate machine: %s", name)
+        vm = IntcodeVM(program, inputs)
+        self.vms[name] = vm
+        self.targets[name] = []
+        self.stats[name] = MachineStats(name)
+        return vm
+
+    def connect(self, source: str, *targets: str) -> None:
+        """
+        Forwards every output of `source` to the input of each target.
+        """
+        for target in targets:
+            if target not in self.vms:
+                raise ValueError("Unknown machine: %s", target)
+            self.targets[source].append(target)
+
+    def _check_idle(self) -> None:
+        if self._waiting == self._running and all(
+                inbox.empty() for inbox in self._inboxes.values()):
+            self._idle.set()
+
+    async def _run_machine(self, name: str) -> None:
+        vm = self.vms[name]
+        stats = self.stats[name]
+        inbox = self._inboxes[name]
+        outboxes = [self._inboxes[target] for target in self.targets[name]]
+        loop = asyncio.get_running_loop()
+        forwarded = len(vm.outputs)
+        while True:
+            waiting = False
+            try:
+                for _ in range(self.slice_steps):
+                    if vm.step() is None:
+                        break
+            except InputUnavailable:
+                waiting = True
+            stats.steps = vm.steps
+            for value in vm.outputs[forwarded:]:
+                for outbox in outboxes:
+                    outbox.put_nowait(value)
+            forwarded = len(vm.outputs)
+
+            if vm.halted:
+                break
+            if not waiting:
+                await asyncio.sleep(0)
+            elif not inbox.empty():
+                vm.send(inbox.get_nowait())
+            else:
+                self._waiting += 1
+                self._check_idle()
+                start = loop.time()
+                value = await inbox.get()
+                stats.input_wait += loop.time() - start
+                self._waiting -= 1
+                vm.send(value)
+
+        stats.halted = True
+        self._running -= 1
+        self._check_idle()
+
+    async def run(self) -> Dict[str, MachineStats]:
+        self._inboxes = {name: asyncio.Queue() for name in self.vms}
+        self._running = len(self.vms)
+        self._waiting = 0
+        self._idle = asyncio.Event()
+
+        machines = asyncio.gather(
+            *(self._run_machine(name) for name in self.vms))
+        idle = asyncio.ensure_future(self._idle.wait())
+        await asyncio.wait({machines, idle},
+                           return_when=asyncio.FIRST_COMPLETED)
+        if not machines.done():
+            machines.cancel()
+        idle.cancel()
+        try:
+            await machines
+        except asyncio.CancelledError:
+            pass
+        return self.stats
+
+
+def run_fleet(
+        program: Sequence[int],
+        input_vectors: Iterable[Sequence[int]],
+        slice_steps: int = SLICE_STEPS,
+        ) -> Tuple[List[List[int]], Dict[str, MachineStats]]:
+    """
+    Runs one independent machine per input vector and returns the outputs
+    of each run, in input order, with the per-machine statistics.
+    """
+    network = Network(slice_steps)
+    vms = [
+        network.add_machine(str(i), program, inputs)
+        for i, inputs in enumerate(input_vectors)
+    ]
+    stats = asyncio.run(network.run())
+    return [vm.outputs for vm in vms], stats
+
+
+if __name__ == "__main__":
+
+    with open("input") as fin:
+        line = fin.readline()
+
+    sequence = [int(x) for x in line.strip().split(',')]
+
+    outputs, stats = run_fleet(sequence, [[1], [5]])
+    for system_outputs, machine_stats in zip(outputs, stats.values()):
+        print(system_outputs[-1], machine_stats)
@@ -0,0 +1,71 @@
+from collections import deque
+
+import pytest
+
+import jit
+import part1
+import part2
+from channels import InputUnavailable
+
+
+# Outputs the running sum of its inputs until it reads a zero.
+ACCUMULATOR = "3,15,1006,15,14,1,15,16,16,4,16,1105,1,0,99,0,0"
+
+
+def _parse(program):
+    return [int(x) for x in program.split(',')]
+
+
+@pytest.mark.parametrize("module", [part2, jit])
+def test_pause_and_resume(module):
+    inputs: deque = deque([1, 2])
+    outputs: list = []
+    if module is jit:
+        machine = jit.CompiledProgram(_parse(ACCUMULATOR), inputs, outputs)
+        execution = machine.execute()
+    else:
+        execution = part2.execute(_parse(ACCUMULATOR), inputs, outputs)
+
+    assert next(execution) == 0
+    assert outputs == [1, 3]
+
+    inputs.extend([3, 4])
+    assert next(execution) == 0
+    assert outputs == [1, 3, 6, 10]
+
+    inputs.append(0)
+    with pytest.raises(StopIteration):
+        next(execution)
+
+
+@pytest.mark.parametrize("module", [part1, part2, jit])
+def test_channel_types(module, capsys):
+    program = "3,9,1001,9,1,9,4,9,99,0"
+
+    outputs: list = []
+    module.run_program(_parse(program), [41], outputs)
+    assert outputs == [42]
+
+    seen = []
+    module.run_program(_parse(program), lambda: 1, seen.append)
+    assert seen == [2]
+
+    with pytest.raises(InputUnavailable):
+        module.run_program(_parse(program), iter([]), [])
+
+    assert capsys.readouterr().out == ""
+
+
+def test_many_machines():
+    machines = []
+    for i in range(1000):
+        inputs: deque = deque()
+        outputs: list = []
+        execution = part2.execute(_parse(ACCUMULATOR), inputs, outputs)
+        next(execution)
+        machines.append((i, inputs, outputs, execution))
+
+    for i, inputs, outputs, execution in machines:
+        inputs.extend([i + 1, i + 1])
+        next(execution)
+        assert outputs == [i + 1, 2 * (i + 1)]
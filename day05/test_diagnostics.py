@@ -0,0 +1,15 @@
+from diagnostics import run_diagnostics
+
+
+def test_run_diagnostics():
+    # Outputs 999, 1000 or 1001 depending on whether the input is below,
+    # equal to or above 8.
+    program = [int(x) for x in (
+        "3,21,1008,21,8,20,1005,20,22,107,8,21,20,1006,20,31,"
+        "1106,0,36,98,0,0,1002,21,125,20,4,20,1105,1,46,104,"
+        "999,1105,1,46,1101,1000,1,20,4,20,1105,1,46,98,99").split(',')]
+    input_vectors = [[i % 17] for i in range(2000)]
+    results = list(run_diagnostics(
+        program, input_vectors, workers=2, chunksize=64))
+    expected = [[999 + (i > 8) + (i >= 8)] for [i] in input_vectors]
+    assert results == expected
@@ -0,0 +1,62 @@
+import part2
+from intcode import IntcodeVM
+
+
+# Outputs the running sum of its inputs until it reads a zero.
+ACCUMULATOR = [3, 15, 1006, 15, 14, 1, 15, 16, 16, 4, 16, 1105, 1, 0, 99,
+               0, 0]
+
+
+def test_matches_interpreter():
+    program = [int(x) for x in (
+        "3,21,1008,21,8,20,1005,20,22,107,8,21,20,1006,20,31,"
+        "1106,0,36,98,0,0,1002,21,125,20,4,20,1105,1,46,104,"
+        "999,1105,1,46,1101,1000,1,20,4,20,1105,1,46,98,99").split(',')]
+    for test_input in [7, 8, 9]:
+        expected_memory = list(program)
+        expected: list = []
+        part2.run_program(expected_memory, [test_input], expected)
+
+        vm = IntcodeVM(program, [test_input])
+        assert vm.run_until_input() is False
+        assert vm.halted
+        assert vm.outputs == expected
+        assert vm.memory.tolist() == expected_memory
+
+
+def test_run_until_output():
+    vm = IntcodeVM(ACCUMULATOR, [1, 2])
+    assert vm.run_until_output() == 1
+    assert vm.run_until_output() == 3
+    assert vm.run_until_output() is None
+    assert not vm.halted
+
+    vm.send(0)
+    assert vm.run_until_output() is None
+    assert vm.halted
+
+
+def test_snapshot_and_restore():
+    vm = IntcodeVM(ACCUMULATOR, [5])
+    assert vm.run_until_input() is True
+    snapshot = vm.snapshot()
+
+    vm.send(1, 0)
+    vm.run_until_input()
+    assert vm.outputs == [5, 6]
+
+    vm.restore(snapshot)
+    assert vm.outputs == [5]
+    vm.send(10, 0)
+    vm.run_until_input()
+    assert vm.outputs == [5, 15]
+
+    branches = []
+    vm.restore(snapshot)
+    for value in range(1, 4):
+        branch = vm.fork()
+        branch.send(value)
+        branch.run_until_input()
+        branches.append(branch.outputs[-1])
+    assert branches == [6, 7, 8]
+    assert vm.outputs == [5]
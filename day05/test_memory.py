@@ -0,0 +1,42 @@
+import part2
+from memory import PagedMemory, PAGE_SIZE
+
+
+def test_paged_memory_copy_on_write():
+    memory = PagedMemory(range(3 * PAGE_SIZE))
+    clone = memory.copy()
+    clone[PAGE_SIZE] = -1
+    memory[0] = -2
+
+    assert memory[PAGE_SIZE] == PAGE_SIZE
+    assert clone[0] == 0
+    assert memory.pages[2] is clone.pages[2]
+    assert memory.pages[1] is not clone.pages[1]
+    assert len(clone.tolist()) == 3 * PAGE_SIZE
+
+
+def test_sparse_overflow_region():
+    memory = PagedMemory([1, 2, 3])
+    assert memory[10**9] == 0
+    memory[10**9] = 7
+    assert memory[10**9] == 7
+    assert len(memory) == 3
+    assert memory.copy()[10**9] == 7
+
+
+def test_wide_values():
+    memory = PagedMemory([2**80, 1])
+    assert memory[0] == 2**80
+    memory = PagedMemory([1, 2])
+    memory[1] = -2**100
+    assert memory.tolist() == [1, -2**100]
+
+
+def test_run_program_past_image():
+    # Multiplies two large numbers into an address past the loaded image and
+    # reads the result back.
+    program = [int(x) for x in "1102,4294967296,4294967296,100,4,100,99"
+               .split(',')]
+    outputs: list = []
+    part2.run_program(PagedMemory(program), [], outputs)
+    assert outputs == [2**64]
@@ -0,0 +1,28 @@
+import json
+
+from profiler import run_program_profiled
+
+
+def test_run_program_profiled():
+    # Counts down from the input, outputting each value.
+    program = [3, 12, 4, 12, 1001, 12, -1, 12, 1005, 12, 2, 99, 0]
+    outputs: list = []
+    profile = run_program_profiled(program, [3], outputs)
+
+    assert outputs == [3, 2, 1]
+    assert profile.opcodes == {3: 1, 4: 3, 1: 3, 5: 3, 99: 1}
+    assert profile.instructions == 11
+    assert profile.addresses[2] == 3
+    assert profile.branch_ratios() == {8: 2 / 3}
+    assert profile.writes == {12: 4}
+    assert profile.reads == {12: 9}
+    assert "jnz;8 3" in profile.folded_stacks().splitlines()
+    assert json.loads(profile.to_json())["opcodes"]["out"] == 3
+
+
+def test_branch_to_next_instruction():
+    # Both jumps land on the instruction right after them.
+    profile = run_program_profiled([1105, 1, 3, 1106, 0, 6, 99], [], [])
+    assert profile.branch_ratios() == {0: 1.0, 3: 1.0}
+    profile = run_program_profiled([1105, 0, 3, 1106, 1, 6, 99], [], [])
+    assert profile.branch_ratios() == {0: 0.0, 3: 0.0}
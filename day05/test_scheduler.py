@@ -0,0 +1,39 @@
+import asyncio
+
+from scheduler import Network, run_fleet
+
+
+def _parse(program):
+    return [int(x) for x in program.split(',')]
+
+
+SOURCE = _parse("104,1,104,2,104,3,99")
+DOUBLER = _parse("3,11,1002,11,2,11,4,11,1105,1,0,0")
+ACCUMULATOR = _parse("3,15,1006,15,14,1,15,16,16,4,16,1105,1,0,99,0,0")
+
+
+def test_fan_out_and_fan_in():
+    network = Network(slice_steps=2)
+    network.add_machine("source", SOURCE)
+    network.add_machine("left", DOUBLER)
+    network.add_machine("right", DOUBLER)
+    sink = network.add_machine("sink", ACCUMULATOR)
+    network.connect("source", "left", "right")
+    network.connect("left", "sink")
+    network.connect("right", "sink")
+
+    stats = asyncio.run(network.run())
+
+    assert sink.outputs[-1] == 24
+    assert len(sink.outputs) == 6
+    assert stats["source"].halted
+    assert stats["source"].steps == 4
+    assert not stats["sink"].halted
+    assert all(s.steps > 0 for s in stats.values())
+
+
+def test_run_fleet():
+    outputs, stats = run_fleet(
+        ACCUMULATOR, [[i, i, 0] for i in range(1, 101)])
+    assert outputs == [[i, 2 * i] for i in range(1, 101)]
+    assert all(s.halted for s in stats.values())